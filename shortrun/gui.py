@@ -6,6 +6,7 @@ import subprocess
 import ctypes
 import time
 import threading
+import weakref
 from typing import List, Optional, Callable, Tuple
 import datetime as dt
 
@@ -88,6 +89,30 @@ def _post_ui(page: ft.Page, fn: Callable[[], None]):
             pass
 
 
+class _UiBridge:
+    """page.pubsub 経由で UI スレッドへ処理を送るブリッジ。
+    page は弱参照で保持し、ページ破棄後に届いた投稿は破棄する。
+    """
+
+    def __init__(self, page: ft.Page):
+        self._page_ref = weakref.ref(page)
+
+    def post(self, fn: Callable[[], None]):
+        page = self._page_ref()
+        if page is None:
+            return
+        page.pubsub.send_all(("__sr_ui__", fn))
+
+    @staticmethod
+    def consume(msg) -> None:
+        """pubsub の購読者。ブリッジから送られた処理だけを実行する。"""
+        try:
+            if isinstance(msg, tuple) and len(msg) == 2 and msg[0] == "__sr_ui__" and callable(msg[1]):
+                msg[1]()
+        except Exception:
+            pass
+
+
 def _show_banner(page: ft.Page, message: str, *, error: bool = False, duration: float = 2.5):
     """ページ上部から短時間スライド表示する通知（オーバーレイ）。
     レイアウトを押し下げないためダイアログ下の余白が発生しません。
@@ -1106,7 +1131,7 @@ class ScanTabUI:
             on_change=lambda e: self._render_list(),
             tooltip="スペース区切りで複数語を指定できます。-foo のように先頭に - を付けると除外します。"
         )
-        self.scan_btn = ft.ElevatedButton("再読み込み", icon=ft.icons.REFRESH, on_click=lambda e: self.scan(), tooltip="アプリの候補一覧を再取得")
+        self.scan_btn = ft.ElevatedButton("再読み込み", icon=ft.icons.REFRESH, on_click=lambda e: self.scan(force=True), tooltip="アプリの候補一覧を再取得")
         self.bulk_add_btn = ft.ElevatedButton("選択したプログラムを一括追加", icon=ft.icons.ADD_TASK, on_click=lambda e: self._bulk_add(), tooltip="チェック済みの候補をまとめて登録")
         self.list_view = ft.ListView(expand=True, spacing=4, padding=8)
 
@@ -1173,7 +1198,9 @@ class ScanTabUI:
     def view(self) -> ft.Control:
         return self._view
 
-    def scan(self):
+    def scan(self, *, force: bool = False):
+        """候補一覧を読み込む。force=True（再読み込みボタンや設定変更時）はキャッシュを使わずに走査し、
+        結果でキャッシュを更新する。"""
         if self._scanning:
             return
         self._scanning = True
@@ -1184,10 +1211,20 @@ class ScanTabUI:
         except Exception:
             pass
 
+        def _on_update(fresh: List[scanner.AppCandidate]):
+            # キャッシュを表示した後にバックグラウンドの再走査で変化が見つかった場合
+            def _apply_update():
+                if self._scanning:
+                    return
+                self.items = fresh
+                self._render_list()
+
+            _post_ui(self.page, _apply_update)
+
         def _work():
             try:
                 show_uninst = bool((self.cfg or {}).get("show_uninstallers", False))
-                items = scanner.scan_all(show_uninstallers=show_uninst)
+                items = scanner.scan_all(show_uninstallers=show_uninst, use_cache=True, refresh=force, on_update=_on_update)
 
                 def _apply():
                     self.items = items
@@ -1480,12 +1517,15 @@ class ScanTabUI:
         )
         self.page.open(dlg)
 
-    def _update_status(self, matched_count: int):
+    def _update_status(self, matched_count: int, *, defer_update: bool = False):
         try:
-            selected_in_view = sum(1 for k in self._selected if k in self._visible_keys)
+            selected_in_view = len(self._selected & self._visible_keys)
             self.status_text.value = f"該当: {matched_count} / 選択: {selected_in_view}"
         except Exception:
             self.status_text.value = f"該当: {matched_count} / 選択: 0"
+        # 呼び出し側でまとめて page.update() する場合は省略
+        if defer_update:
+            return
         try:
             self.page.update()
         except Exception:
@@ -1508,9 +1548,9 @@ class ScanTabUI:
                         cb.value = False
         except Exception:
             pass
-        # 件数ステータスのみ更新
+        # 件数ステータスを更新し、チェック解除と合わせて一度だけ反映
         try:
-            self._update_status(len(getattr(self, "_visible_keys", set())))
+            self._update_status(len(getattr(self, "_visible_keys", set())), defer_update=True)
         except Exception:
             pass
         try:
@@ -1849,15 +1889,10 @@ def main(page: ft.Page):
 
     # UIスレッド実行ヘルパ（pubsub）を登録しておくと、バックグラウンドからの UI 更新確認が容易
     try:
-        def _sr_ui_consumer(msg):
-            try:
-                if isinstance(msg, tuple) and len(msg) == 2 and msg[0] == "__sr_ui__" and callable(msg[1]):
-                    msg[1]()
-            except Exception:
-                pass
-        page.pubsub.subscribe(_sr_ui_consumer)
-        page._sr_post_ui = lambda fn: page.pubsub.send_all(("__sr_ui__", fn))
+        page.pubsub.subscribe(_UiBridge.consume)
+        page._sr_post_ui = _UiBridge(page).post
     except Exception:
+        # pubsub が使えない環境では呼び出し元スレッドで直接実行する（明示的なフォールバック）
         page._sr_post_ui = lambda fn: fn()
 
     cfg = settings.load_config()
@@ -1873,18 +1908,40 @@ def main(page: ft.Page):
     scan_ui = ScanTabUI(page, on_alias_added=alias_ui.refresh, cfg=cfg)
     # 双方向の通知: エイリアス変更時に探索を再描画
     alias_ui.on_alias_changed = scan_ui.scan
-    settings_ui = SettingsTabUI(page, cfg, on_config_changed=lambda: scan_ui.scan())
+
+    # 設定の連続切替で毎回スキャンしないよう、最後の変更から少し待って 1 回だけ実行
+    pending_scan: list[Optional[threading.Timer]] = [None]
+
+    def _deferred_scan():
+        # 設定タブで更新された値（アンインストーラ表示など）を探索タブにも反映する
+        scan_ui.cfg = settings_ui.cfg
+        prev = pending_scan[0]
+        if prev is not None:
+            prev.cancel()
+        t = threading.Timer(0.3, lambda: _post_ui(page, lambda: scan_ui.scan(force=True)))
+        t.daemon = True
+        pending_scan[0] = t
+        t.start()
+
+    settings_ui = SettingsTabUI(page, cfg, on_config_changed=_deferred_scan)
     schedule_tab = ScheduleTabUI(page)
 
-    def on_tab_changed(e: ft.ControlEvent):
+    # 最後に処理したタブ位置（同一タブへの重複通知で再読み込みしないため）。初期表示のタブから始める
+    initial_tab = 0
+    last_idx = [initial_tab]
+
+    def _on_tab_selected(idx: int):
         # タブ順: 0:アプリ一覧, 1:スケジュール一覧, 2:プログラム, 3:設定
-        if e.control.selected_index == 1:
+        if idx == last_idx[0]:
+            return
+        last_idx[0] = idx
+        if idx == 1:
             # スケジュール一覧に切替時のみリフレッシュ
             try:
                 schedule_tab.refresh()
             except Exception:
                 pass
-        if e.control.selected_index == 2:
+        if idx == 2:
             # プログラムタブに切替時のみ、エイリアスと探索を更新
             try:
                 alias_ui.refresh()
@@ -1894,12 +1951,15 @@ def main(page: ft.Page):
                 scan_ui.scan()
             except Exception:
                 pass
-        # タブ位置を保存
-        settings.set_last_tab(cfg, e.control.selected_index)
+        # タブ位置を保存（タブ切替の保存はここだけで行う）
+        settings.set_last_tab(cfg, idx)
+
+    def on_tab_changed(e: ft.ControlEvent):
+        _on_tab_selected(e.control.selected_index)
 
     tabs = ft.Tabs(
         expand=True,
-        selected_index=0,
+        selected_index=initial_tab,
         animation_duration=450,
         tabs=[
             ft.Tab(text="アプリ一覧", content=scan_ui.view()),
@@ -1916,6 +1976,8 @@ def main(page: ft.Page):
         # プログラムタブへ遷移（タブ順: 0:アプリ一覧, 1:スケジュール一覧, 2:プログラム, 3:設定）
         tabs.selected_index = 2
         page.update()
+        # 代入で on_change が呼ばれない場合も、タブ切替と同じ処理（更新・保存）を 1 回だけ通す
+        _on_tab_selected(2)
 
     scan_ui.on_request_prefill = go_to_alias
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
+import logging
 import os
-import re
+import string
 import winreg
 from dataclasses import dataclass
 from typing import List, Optional
@@ -9,10 +10,14 @@ APP_PATHS_KEY = r"Software\\Microsoft\\Windows\\CurrentVersion\\App Paths"
 MARKER_NAME = "ShortRun"
 MARKER_VALUE = "1"
 
-_alias_re = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+# 使用可能文字を取り除いた結果が空なら妥当（C 実装の str.translate で判定）
+_ALIAS_CHARS = string.ascii_letters + string.digits + "_-"
+_alias_strip_table = str.maketrans("", "", _ALIAS_CHARS)
 
+_log = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(slots=True)
 class AliasEntry:
     alias: str
     exe_path: str
@@ -21,16 +26,45 @@ class AliasEntry:
     comment: Optional[str] = None
 
 
+def _abspath(path: str) -> str:
+    # ドライブ/UNC 付きの絶対パスは getcwd を伴う abspath を省き、正規化（/ → \、. や .. の解消）のみ行う。
+    # Python 3.12 未満では \foo のようなドライブ無しのパスも isabs が真になるため、ドライブの有無も確認する
+    if os.path.splitdrive(path)[0] and os.path.isabs(path):
+        return os.path.normpath(path)
+    return os.path.abspath(path)
+
+
 def _app_paths_subkey_name(alias: str) -> str:
     # Win+R は拡張子無しでも解決するため、App Paths 上は <alias>.exe で登録する
     return f"{alias}.exe"
 
 
 def validate_alias(alias: str) -> None:
-    if not _alias_re.match(alias):
+    if not (1 <= len(alias) <= 64) or alias.translate(_alias_strip_table):
         raise ValueError("エイリアスは英数字、ハイフン、アンダースコアで 1〜64 文字にしてください。")
 
 
+def _read_run_as_admin(sk) -> bool:
+    """RunAsAdmin を読む（存在しない場合は False）。
+    通常は REG_DWORD で書き込むため型コードで分岐し、REG_SZ は旧形式としてのみ解釈する。
+    """
+    try:
+        ra, rtype = winreg.QueryValueEx(sk, "RunAsAdmin")
+    except FileNotFoundError:
+        return False
+    if rtype == winreg.REG_DWORD:
+        return bool(ra)
+    return str(ra).strip().lower() in ("1", "true", "yes")
+
+
+def _write_run_as_admin(sk, run_as_admin: bool) -> None:
+    """RunAsAdmin を REG_DWORD で書き込む。失敗は警告を記録して無視する。"""
+    try:
+        winreg.SetValueEx(sk, "RunAsAdmin", 0, winreg.REG_DWORD, 1 if run_as_admin else 0)
+    except OSError as ex:
+        _log.warning("RunAsAdmin を書き込めませんでした: %s", ex)
+
+
 def _open_app_paths_key(access=winreg.KEY_READ):
     return winreg.OpenKey(winreg.HKEY_CURRENT_USER, APP_PATHS_KEY, 0, access)
 
@@ -64,16 +98,7 @@ def list_aliases() -> List[AliasEntry]:
                         except FileNotFoundError:
                             continue
                         # 追加フラグ（存在しない場合は False）
-                        run_admin = False
-                        try:
-                            ra, _ = winreg.QueryValueEx(sk, "RunAsAdmin")
-                            # REG_SZ/REG_DWORD いずれも受け入れる
-                            if isinstance(ra, int):
-                                run_admin = bool(ra)
-                            else:
-                                run_admin = str(ra).strip().lower() in ("1", "true", "yes")
-                        except FileNotFoundError:
-                            run_admin = False
+                        run_admin = _read_run_as_admin(sk)
                         alias = name[:-4] if name.lower().endswith(".exe") else name
                         entries.append(AliasEntry(alias=alias, exe_path=exe_path, run_as_admin=run_admin))
                 except OSError:
@@ -96,15 +121,7 @@ def get_alias(alias: str) -> Optional[AliasEntry]:
                     return None
                 exe_path, _ = winreg.QueryValueEx(sk, None)
                 # 追加フラグ（存在しない場合は False）
-                run_admin = False
-                try:
-                    ra, _ = winreg.QueryValueEx(sk, "RunAsAdmin")
-                    if isinstance(ra, int):
-                        run_admin = bool(ra)
-                    else:
-                        run_admin = str(ra).strip().lower() in ("1", "true", "yes")
-                except FileNotFoundError:
-                    run_admin = False
+                run_admin = _read_run_as_admin(sk)
                 return AliasEntry(alias=alias, exe_path=exe_path, run_as_admin=run_admin)
     except FileNotFoundError:
         return None
@@ -112,7 +129,7 @@ def get_alias(alias: str) -> Optional[AliasEntry]:
 
 def add_alias(alias: str, exe_path: str, overwrite: bool = False) -> AliasEntry:
     validate_alias(alias)
-    exe_path = os.path.abspath(exe_path)
+    exe_path = _abspath(exe_path)
     if not os.path.isfile(exe_path):
         raise FileNotFoundError(f"EXE が見つかりません: {exe_path}")
     name = _app_paths_subkey_name(alias)
@@ -140,14 +157,8 @@ def add_alias(alias: str, exe_path: str, overwrite: bool = False) -> AliasEntry:
         winreg.SetValueEx(sk, None, 0, winreg.REG_SZ, exe_path)
         winreg.SetValueEx(sk, "Path", 0, winreg.REG_SZ, os.path.dirname(exe_path))
         winreg.SetValueEx(sk, MARKER_NAME, 0, winreg.REG_SZ, MARKER_VALUE)
-        # 既定は管理者権限で実行しない
-        try:
-            winreg.SetValueEx(sk, "RunAsAdmin", 0, winreg.REG_DWORD, 0)
-        except Exception:
-            try:
-                winreg.SetValueEx(sk, "RunAsAdmin", 0, winreg.REG_SZ, "0")
-            except Exception:
-                pass
+        # 既定は管理者権限で実行しない（書けなくても未設定 = False と同じ扱い）
+        _write_run_as_admin(sk, False)
 
     return AliasEntry(alias=alias, exe_path=exe_path, run_as_admin=False)
 
@@ -176,7 +187,7 @@ def update_alias(old_alias: str, new_alias: str, new_exe_path: str, overwrite: b
     戻り値は最終的な AliasEntry。
     """
     validate_alias(new_alias)
-    new_exe_path = os.path.abspath(new_exe_path)
+    new_exe_path = _abspath(new_exe_path)
     if not os.path.isfile(new_exe_path):
         raise FileNotFoundError(f"EXE が見つかりません: {new_exe_path}")
 
@@ -187,16 +198,8 @@ def update_alias(old_alias: str, new_alias: str, new_exe_path: str, overwrite: b
             winreg.SetValueEx(sk, None, 0, winreg.REG_SZ, new_exe_path)
             winreg.SetValueEx(sk, "Path", 0, winreg.REG_SZ, os.path.dirname(new_exe_path))
             winreg.SetValueEx(sk, MARKER_NAME, 0, winreg.REG_SZ, MARKER_VALUE)
-        # RunAsAdmin は既存値を温存
-        run_admin = False
-        try:
-            ra, _ = winreg.QueryValueEx(sk, "RunAsAdmin")
-            if isinstance(ra, int):
-                run_admin = bool(ra)
-            else:
-                run_admin = str(ra).strip().lower() in ("1", "true", "yes")
-        except Exception:
-            run_admin = False
+            # RunAsAdmin は既存値を温存（キーを閉じる前に読む）
+            run_admin = _read_run_as_admin(sk)
         return AliasEntry(alias=new_alias, exe_path=new_exe_path, run_as_admin=run_admin)
 
     # alias が変わる場合
@@ -210,13 +213,7 @@ def update_alias(old_alias: str, new_alias: str, new_exe_path: str, overwrite: b
         winreg.SetValueEx(sk, None, 0, winreg.REG_SZ, new_exe_path)
         winreg.SetValueEx(sk, "Path", 0, winreg.REG_SZ, os.path.dirname(new_exe_path))
         winreg.SetValueEx(sk, MARKER_NAME, 0, winreg.REG_SZ, MARKER_VALUE)
-        try:
-            winreg.SetValueEx(sk, "RunAsAdmin", 0, winreg.REG_DWORD, 0)
-        except Exception:
-            try:
-                winreg.SetValueEx(sk, "RunAsAdmin", 0, winreg.REG_SZ, "0")
-            except Exception:
-                pass
+        _write_run_as_admin(sk, False)
 
     # 旧キー削除（ShortRun フラグ確認の上）
     remove_alias(old_alias)
@@ -226,11 +223,9 @@ def update_alias(old_alias: str, new_alias: str, new_exe_path: str, overwrite: b
 def set_run_as_admin(alias: str, run_as_admin: bool) -> None:
     """エイリアスに対して「管理者として実行」フラグを設定する。"""
     name = _app_paths_subkey_name(alias)
-    with winreg.CreateKey(winreg.HKEY_CURRENT_USER, os.path.join(APP_PATHS_KEY, name)) as sk:
-        try:
-            winreg.SetValueEx(sk, "RunAsAdmin", 0, winreg.REG_DWORD, 1 if run_as_admin else 0)
-        except Exception:
-            try:
-                winreg.SetValueEx(sk, "RunAsAdmin", 0, winreg.REG_SZ, "1" if run_as_admin else "0")
-            except Exception:
-                pass
+    try:
+        with winreg.CreateKey(winreg.HKEY_CURRENT_USER, os.path.join(APP_PATHS_KEY, name)) as sk:
+            _write_run_as_admin(sk, run_as_admin)
+    except OSError as ex:
+        # 従来どおり書き込み失敗で GUI 側へ例外を伝えない
+        _log.warning("%s の RunAsAdmin を設定できませんでした: %s", alias, ex)
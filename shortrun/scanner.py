@@ -1,40 +1,67 @@
 from __future__ import annotations
+import atexit
 import os
 import re
 import sys
 import json
 import winreg
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+import struct
 import subprocess
 import base64
-import json
-
-try:
-    # pywin32
-    import win32com.client  # type: ignore
-except Exception:  # pragma: no cover
-    win32com = None  # type: ignore
+import ctypes
+import concurrent.futures
+import dataclasses
+import functools
+import hashlib
+import itertools
+import threading
+import uuid
+
+# pywin32 は .lnk 解決時にのみ必要なため遅延読み込みする（None=未試行, False=利用不可）
+_win32com_client = None
+
+
+def _get_win32com():
+    """Import win32com.client on first use and memoize it (None if unavailable)."""
+    global _win32com_client
+    if _win32com_client is None:
+        try:
+            import win32com.client  # type: ignore
+            _win32com_client = win32com.client
+        except Exception:  # pragma: no cover
+            _win32com_client = False
+    return _win32com_client or None
 
 START_MENU_DIRS = [
     os.path.join(os.environ.get("ProgramData", r"C:\\ProgramData"), r"Microsoft\Windows\Start Menu\Programs"),
     os.path.join(os.environ.get("APPDATA", r""), r"Microsoft\Windows\Start Menu\Programs"),
 ]
 
-UNINSTALL_REG_PATHS = [
-    (winreg.HKEY_LOCAL_MACHINE, r"Software\Microsoft\Windows\CurrentVersion\Uninstall", winreg.KEY_WOW64_64KEY),
-    (winreg.HKEY_LOCAL_MACHINE, r"Software\Microsoft\Windows\CurrentVersion\Uninstall", winreg.KEY_WOW64_32KEY),
-    (winreg.HKEY_CURRENT_USER, r"Software\Microsoft\Windows\CurrentVersion\Uninstall", 0),
-]
+# (root, path, access, source) — source はビューごとに固定なので表として持つ
+UNINSTALL_REG_PATHS_WITH_SOURCE = (
+    (winreg.HKEY_LOCAL_MACHINE, r"Software\Microsoft\Windows\CurrentVersion\Uninstall", winreg.KEY_WOW64_64KEY, "uninstall64"),
+    (winreg.HKEY_LOCAL_MACHINE, r"Software\Microsoft\Windows\CurrentVersion\Uninstall", winreg.KEY_WOW64_32KEY, "uninstall32"),
+    (winreg.HKEY_CURRENT_USER, r"Software\Microsoft\Windows\CurrentVersion\Uninstall", 0, "uninstall_user"),
+)
+UNINSTALL_REG_PATHS = [(root, path, access) for root, path, access, _src in UNINSTALL_REG_PATHS_WITH_SOURCE]
+_UNINSTALL_SOURCE_BY_ACCESS = {access: src for _root, _path, access, src in UNINSTALL_REG_PATHS_WITH_SOURCE}
 
-_icon_path_re = re.compile(r"^\s*\"?(?P<path>[A-Za-z]:[^,\"]+?\.exe)\"?(?:,.*)?$")
+# DisplayIcon 例: "C:\x\app.exe",0 / C:\x\app.EXE / "C:\x\app.exe" /arg
+# 先頭のクォートを読み飛ばし、区切り（" / 空白 / , / 末尾）が続く .exe までを 1 回の走査で取り出す
+# （foo.exec\ や x.exe.d\ のような途中の ".exe" では止まらない）
+_icon_path_re = re.compile(r'^\s*"?(?P<path>[^"]*?\.exe)(?=["\s,]|$)', re.IGNORECASE)
 
 
-@dataclass
+@dataclass(slots=True)
 class AppCandidate:
     name: str
     exe_path: str
     source: str  # uninstall64/uninstall32/startmenu_system/startmenu_user
+    # .lnk の場合の解決済みリンク先（resolve_targets 指定時のみ設定）
+    target_exe: Optional[str] = None
 
 
 # Browser-based installed app proxy executables (PWA proxies etc.) to exclude
@@ -63,6 +90,15 @@ _UNINSTALL_PATTERNS = (
     r"(^|[^a-z])remove(r)?([^a-z]|$)",
 )
 _uninst_re = re.compile("|".join(_UNINSTALL_PATTERNS), re.IGNORECASE)
+# 正規表現の前段フィルタ（いずれも含まなければ正規表現は不要）
+_UNINST_KEYWORDS = ("uninstall", "setup", "unins", "remove")
+
+
+def _matches_uninstaller(text: str) -> bool:
+    lowered = text.lower()
+    if not any(k in lowered for k in _UNINST_KEYWORDS):
+        return False
+    return bool(_uninst_re.search(lowered))
 
 
 def _looks_uninstaller(name_or_path: str) -> bool:
@@ -70,8 +106,33 @@ def _looks_uninstaller(name_or_path: str) -> bool:
         s = (name_or_path or "")
     except Exception:
         return False
-    b = os.path.basename(s)
-    return bool(_uninst_re.search(b))
+    return _matches_uninstaller(os.path.basename(s))
+
+
+def _make_startupinfo():
+    """Hidden-window STARTUPINFO, or None when unavailable (non-Windows)."""
+    try:
+        si = subprocess.STARTUPINFO()  # type: ignore[attr-defined]
+        si.dwFlags |= getattr(subprocess, 'STARTF_USESHOWWINDOW', 0)
+        si.wShowWindow = 0  # SW_HIDE
+        return si
+    except Exception:
+        return None
+
+
+# 呼び出しごとに作らずモジュール読み込み時に 1 度だけ用意する
+# （Popen は渡された STARTUPINFO をコピーして使うため共有しても安全）
+_SI = _make_startupinfo() if os.name == 'nt' else None
+_CFLAGS = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+
+def _popen_no_window(args: List[str], **kwargs) -> subprocess.Popen:
+    """Popen counterpart of _run_no_window (for streaming stdout)."""
+    if os.name == 'nt':
+        kwargs.setdefault('startupinfo', _SI)
+        kwargs.setdefault('creationflags', _CFLAGS)
+        kwargs.setdefault('shell', False)
+    return subprocess.Popen(args, **kwargs)
 
 
 def _run_no_window(args: List[str], **kwargs) -> subprocess.CompletedProcess:
@@ -79,50 +140,127 @@ def _run_no_window(args: List[str], **kwargs) -> subprocess.CompletedProcess:
     Returns CompletedProcess. Adds startupinfo/creationflags when os.name == 'nt'.
     """
     if os.name == 'nt':
-        try:
-            si = subprocess.STARTUPINFO()
-            si.dwFlags |= getattr(subprocess, 'STARTF_USESHOWWINDOW', 0)
-            si.wShowWindow = 0  # SW_HIDE
-        except Exception:
-            si = None  # type: ignore
-        creationflags = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
-        kwargs.setdefault('startupinfo', si)
-        kwargs.setdefault('creationflags', creationflags)
+        kwargs.setdefault('startupinfo', _SI)
+        kwargs.setdefault('creationflags', _CFLAGS)
         kwargs.setdefault('shell', False)
     return subprocess.run(args, **kwargs)
 
 
-def _iter_registry_keys(root, subkey, access) -> Iterable[Tuple[str, str]]:
+@contextmanager
+def _open_key_children(root, subkey, access) -> Iterator[Tuple[Optional[winreg.HKEYType], List[str]]]:
+    """Yield (parent_handle, child_names); the parent stays open inside the
+    with-block so children can be opened relative to it instead of by full path.
+    Yields (None, []) if the key does not exist.
+    """
     try:
-        with winreg.OpenKey(root, subkey, 0, winreg.KEY_READ | access) as k:
-            i = 0
-            while True:
-                try:
-                    name = winreg.EnumKey(k, i)
-                except OSError:
-                    break
-                i += 1
-                yield (subkey, name)
+        k = winreg.OpenKey(root, subkey, 0, winreg.KEY_READ | access)
     except FileNotFoundError:
+        yield (None, [])
         return
+    with k:
+        names: List[str] = []
+        i = 0
+        while True:
+            try:
+                names.append(winreg.EnumKey(k, i))
+            except OSError:
+                break
+            i += 1
+        yield (k, names)
+
+
+def _get_reg_three(parent, name, access=0) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Return (DisplayName, DisplayIcon, InstallLocation) of a subkey.
+    Only these three values are queried (no EnumValue walk); missing or
+    non-string values come back as None.
+    parent is an already-open handle from _open_key_children.
+    """
+    try:
+        with winreg.OpenKey(parent, name, 0, winreg.KEY_READ | access) as sk:
+            return (_query_str(sk, "DisplayName"), _query_str(sk, "DisplayIcon"), _query_str(sk, "InstallLocation"))
+    except FileNotFoundError:
+        return (None, None, None)
 
 
-def _get_reg_values(root, path, name) -> Dict[str, str]:
+def _query_str(sk, vname: str) -> Optional[str]:
     try:
-        with winreg.OpenKey(root, os.path.join(path, name)) as sk:
-            values: Dict[str, str] = {}
-            j = 0
-            while True:
-                try:
-                    vname, vdata, _ = winreg.EnumValue(sk, j)
-                except OSError:
-                    break
-                j += 1
-                if isinstance(vdata, str):
-                    values[vname] = vdata
-            return values
-    except FileNotFoundError:
-        return {}
+        vdata, _ = winreg.QueryValueEx(sk, vname)
+    except OSError:
+        return None
+    return vdata if isinstance(vdata, str) else None
+
+
+_INVALID_FILE_ATTRIBUTES = 0xFFFFFFFF
+_FILE_ATTRIBUTE_DIRECTORY = 0x10
+
+# os.path.isfile は stat 相当（ハンドルを開く）になるため、属性取得 1 回で済む
+# GetFileAttributesW を使う。専用の WinDLL を使い、共有の windll の argtypes は汚さない
+try:
+    _GetFileAttributesW = ctypes.WinDLL("kernel32", use_last_error=True).GetFileAttributesW  # type: ignore[attr-defined]
+    _GetFileAttributesW.argtypes = [ctypes.c_wchar_p]
+    _GetFileAttributesW.restype = ctypes.c_uint32
+except (AttributeError, OSError):
+    _GetFileAttributesW = None
+
+
+def _file_attrs(p: str) -> Optional[int]:
+    """Raw attribute bits of p, or None if it does not exist."""
+    attr = _GetFileAttributesW(p)
+    return None if attr == _INVALID_FILE_ATTRIBUTES else attr
+
+
+def _isfile_raw(p: str) -> bool:
+    if _GetFileAttributesW is None:
+        return os.path.isfile(p)
+    attr = _file_attrs(p)
+    return attr is not None and not attr & _FILE_ATTRIBUTE_DIRECTORY
+
+
+def _isdir_raw(p: str) -> bool:
+    if _GetFileAttributesW is None:
+        return os.path.isdir(p)
+    attr = _file_attrs(p)
+    return attr is not None and bool(attr & _FILE_ATTRIBUTE_DIRECTORY)
+
+
+# isfile/isdir の結果はスキャン中ほぼ変わらないためメモ化する。
+# メモはスキャン（_fs_memo の範囲）の間だけ有効で、範囲外の呼び出しは毎回確認する
+_isfile_memo = functools.lru_cache(maxsize=8192)(_isfile_raw)
+_isdir_memo = functools.lru_cache(maxsize=8192)(_isdir_raw)
+_fs_memo_lock = threading.Lock()
+_fs_memo_users = 0
+
+
+def _clear_fs_memo() -> None:
+    _isfile_memo.cache_clear()
+    _isdir_memo.cache_clear()
+
+
+@contextmanager
+def _fs_memo():
+    """Enable the isfile/isdir memo for one scan; it is discarded when the
+    last concurrent scan leaves.
+    """
+    global _fs_memo_users
+    with _fs_memo_lock:
+        if _fs_memo_users == 0:
+            _clear_fs_memo()
+        _fs_memo_users += 1
+    try:
+        yield
+    finally:
+        with _fs_memo_lock:
+            _fs_memo_users -= 1
+            if _fs_memo_users == 0:
+                _clear_fs_memo()
+
+
+def _isfile(p: str) -> bool:
+    return _isfile_memo(p) if _fs_memo_users else _isfile_raw(p)
+
+
+def _isdir(p: str) -> bool:
+    return _isdir_memo(p) if _fs_memo_users else _isdir_raw(p)
 
 
 def _extract_exe_from_display_icon(display_icon: str) -> Optional[str]:
@@ -131,72 +269,360 @@ def _extract_exe_from_display_icon(display_icon: str) -> Optional[str]:
     m = _icon_path_re.match(display_icon)
     if m:
         exe = m.group("path")
-        if os.path.isfile(exe):
-            return exe
-    # Fallback: 先頭のクォートを外して .exe を含む部分を探す
-    s = display_icon.strip().strip('"')
-    idx = s.lower().find('.exe')
-    if idx != -1:
-        exe = s[: idx + 4]
-        if os.path.isfile(exe):
+        if _isfile(exe):
             return exe
     return None
 
 
-def scan_uninstall(*, show_uninstallers: bool = False) -> List[AppCandidate]:
-    results: List[AppCandidate] = []
-    for root, path, access in UNINSTALL_REG_PATHS:
-        source = (
-            "uninstall64" if access == winreg.KEY_WOW64_64KEY else (
-                "uninstall32" if access == winreg.KEY_WOW64_32KEY else "uninstall_user"
+# サブキー単位の読み取りスレッド数（待ち時間中心のためコア数より多めでよい）
+_UNINSTALL_READ_WORKERS = 8
+
+# 全ビューで共有する読み取り用スレッドプール（ビューごとに作らず、スレッド数を上記に抑える）
+_read_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_read_pool_lock = threading.Lock()
+
+
+def _get_read_pool() -> concurrent.futures.ThreadPoolExecutor:
+    global _read_pool
+    with _read_pool_lock:
+        if _read_pool is None:
+            _read_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=_UNINSTALL_READ_WORKERS,
+                thread_name_prefix="shortrun-scan",
             )
-        )
-        for _parent, name in _iter_registry_keys(root, path, access):
-            vals = _get_reg_values(root, path, name)
-            display_name = vals.get("DisplayName")
-            if not display_name:
-                continue
-            display_icon = vals.get("DisplayIcon", "")
-            install_loc = vals.get("InstallLocation", "")
-            exe = _extract_exe_from_display_icon(display_icon)
-            if not exe and install_loc and os.path.isdir(install_loc):
-                # よくあるパターン: <InstallLocation>\<DisplayName>.exe
-                guess = os.path.join(install_loc, f"{display_name}.exe")
-                if os.path.isfile(guess):
-                    exe = guess
-            # exclude browser proxy executables
-            if exe and _is_proxy_exe(exe):
-                continue
-            if exe:
-                # exclude obvious uninstallers unless explicitly allowed
-                if not show_uninstallers and (
-                    _looks_uninstaller(exe) or _looks_uninstaller(display_name or "")
-                ):
+            atexit.register(_read_pool.shutdown, wait=False)
+        return _read_pool
+
+
+def _read_uninstall_entry(parent, name: str, access) -> Optional[Tuple[str, str]]:
+    """Return (DisplayName, exe) for one uninstall subkey, or None."""
+    display_name, display_icon, install_loc = _get_reg_three(parent, name, access)
+    if not display_name:
+        return None
+    exe = _extract_exe_from_display_icon(display_icon or "")
+    if not exe and install_loc and _isdir(install_loc):
+        # よくあるパターン: <InstallLocation>\<DisplayName>.exe
+        guess = os.path.join(install_loc, f"{display_name}.exe")
+        if _isfile(guess):
+            exe = guess
+    if not exe:
+        return None
+    return (display_name, exe)
+
+
+def _scan_uninstall_hive(root, path, access, source: Optional[str] = None, *, show_uninstallers: bool = False, dedup: bool = False) -> Iterator[AppCandidate]:
+    """Scan a single UNINSTALL_REG_PATHS_WITH_SOURCE entry.
+    With dedup=True, entries whose exe (case-insensitive) was already accepted
+    in this view are skipped before the proxy/uninstaller filters run.
+    """
+    if source is None:
+        source = _UNINSTALL_SOURCE_BY_ACCESS.get(access, "uninstall_user")
+    with _open_key_children(root, path, access) as (parent, names):
+        if not names:
+            return
+        # サブキーごとの読み取り（OpenKey/QueryValueEx/isfile）は互いに独立して
+        # システムコール待ちが大半のため並列化する。map なので順序は保たれる
+        entries = list(_get_read_pool().map(lambda n: _read_uninstall_entry(parent, n, access), names))
+    seen: set[str] = set()
+    for entry in entries:
+        if entry is None:
+            continue
+        display_name, exe = entry
+        key = exe.lower()
+        if dedup and key in seen:
+            continue
+        # exclude browser proxy executables
+        if _is_proxy_exe(exe):
+            continue
+        # exclude obvious uninstallers unless explicitly allowed
+        # exe 名と表示名を 1 回で判定（改行は単語境界として扱われる）
+        if not show_uninstallers and _matches_uninstaller(
+            os.path.basename(exe) + "\n" + os.path.basename(display_name or "")
+        ):
+            continue
+        # フィルタを通過したものだけ既出扱いにする
+        if dedup:
+            seen.add(key)
+        yield AppCandidate(name=display_name, exe_path=exe, source=source)
+
+
+def scan_uninstall(*, show_uninstallers: bool = False, dedup: bool = False) -> Iterator[AppCandidate]:
+    """Yield uninstall-registry candidates (wrap in list() if a list is needed).
+    dedup=True drops entries whose exe path was already yielded by an earlier view.
+    """
+    # 3 つのビューを並列に走査し、表の順に連結する
+    # （メモは最初の yield より前の一括走査の間だけ使う）
+    with _fs_memo(), concurrent.futures.ThreadPoolExecutor(max_workers=len(UNINSTALL_REG_PATHS_WITH_SOURCE)) as ex:
+        results = list(ex.map(
+            lambda v: list(_scan_uninstall_hive(*v, show_uninstallers=show_uninstallers, dedup=dedup)),
+            UNINSTALL_REG_PATHS_WITH_SOURCE,
+        ))
+    if not dedup:
+        yield from itertools.chain.from_iterable(results)
+        return
+    seen: set[str] = set()
+    for it in itertools.chain.from_iterable(results):
+        key = it.exe_path.lower()
+        if key not in seen:
+            seen.add(key)
+            yield it
+
+
+def _iter_lnk_entries(root_dir: str) -> Iterator[os.DirEntry]:
+    """Recursively yield .lnk DirEntry objects using os.scandir.
+    DirEntry caches the type from the directory read, so files are not
+    re-stat'ed as with os.walk.
+    """
+    stack = [root_dir]
+    while stack:
+        d = stack.pop()
+        try:
+            it = os.scandir(d)
+        except OSError:
+            continue
+        with it:
+            subdirs: List[str] = []
+            for e in it:
+                try:
+                    if e.is_dir(follow_symlinks=False):
+                        subdirs.append(e.path)
+                    # 名前全体ではなく末尾 4 文字だけを小文字化して判定
+                    elif e.name[-4:].lower() == ".lnk":
+                        yield e
+                except OSError:
                     continue
-                results.append(AppCandidate(name=display_name, exe_path=exe, source=source))
-    return results
+        # os.walk と同じく上から順に辿る
+        stack.extend(reversed(subdirs))
 
 
 def _iter_shortcuts(root_dir: str) -> Iterable[str]:
-    if not root_dir or not os.path.isdir(root_dir):
+    if not root_dir or not _isdir(root_dir):
         return
-    for base, _dirs, files in os.walk(root_dir):
-        for fn in files:
-            if fn.lower().endswith(".lnk"):
-                yield os.path.join(base, fn)
+    for e in _iter_lnk_entries(root_dir):
+        yield e.path
 
 
-def _resolve_lnk_target(path: str) -> Optional[str]:
-    # First try via pywin32
-    if win32com is not None:
+# --- .lnk parsing (MS-SHLLINK) ----------------------------------------------
+
+_LNK_HEADER_SIZE = 0x4C
+_LNK_HAS_TARGET_ID_LIST = 0x1
+_LNK_HAS_LINK_INFO = 0x2
+_LNK_FORCE_NO_LINK_INFO = 0x100
+_LNK_INFO_VOLUME_ID_AND_LOCAL_BASE_PATH = 0x1
+_LNK_ANSI_ENCODING = "mbcs" if os.name == 'nt' else "latin-1"
+
+
+def _lnk_cstr(buf: bytes, offset: int, unicode: bool) -> str:
+    if unicode:
+        end = offset
+        while end + 1 < len(buf) and buf[end:end + 2] != b"\0\0":
+            end += 2
+        return buf[offset:end].decode("utf-16-le", errors="ignore")
+    end = buf.find(b"\0", offset)
+    if end == -1:
+        end = len(buf)
+    return buf[offset:end].decode(_LNK_ANSI_ENCODING, errors="ignore")
+
+
+def _parse_lnk(path: str) -> Optional[str]:
+    """Read the local target path straight from a .lnk file (no COM/PowerShell).
+    Returns LocalBasePath(+CommonPathSuffix) from the LinkInfo structure, or
+    None when the link has no LinkInfo (e.g. MSI advertised shortcuts) or is
+    malformed, so that callers can fall back to COM.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < _LNK_HEADER_SIZE or struct.unpack_from("<I", data, 0)[0] != _LNK_HEADER_SIZE:
+            return None
+        flags = struct.unpack_from("<I", data, 0x14)[0]
+        if not (flags & _LNK_HAS_LINK_INFO) or (flags & _LNK_FORCE_NO_LINK_INFO):
+            return None
+        pos = _LNK_HEADER_SIZE
+        if flags & _LNK_HAS_TARGET_ID_LIST:
+            pos += 2 + struct.unpack_from("<H", data, pos)[0]
+        info_size, info_header_size, info_flags = struct.unpack_from("<III", data, pos)
+        if not (info_flags & _LNK_INFO_VOLUME_ID_AND_LOCAL_BASE_PATH):
+            return None
+        info = data[pos:pos + info_size]
+        base_off, _net_off, suffix_off = struct.unpack_from("<III", info, 0x10)
+        if info_header_size >= 0x24:
+            # Unicode 版のオフセットがあれば優先
+            base_off_u, suffix_off_u = struct.unpack_from("<II", info, 0x1C)
+            base = _lnk_cstr(info, base_off_u, True) if base_off_u else _lnk_cstr(info, base_off, False)
+            suffix = _lnk_cstr(info, suffix_off_u, True) if suffix_off_u else _lnk_cstr(info, suffix_off, False)
+        else:
+            base = _lnk_cstr(info, base_off, False)
+            suffix = _lnk_cstr(info, suffix_off, False)
+        target = base + suffix
+        return target or None
+    except (OSError, struct.error, ValueError):
+        return None
+
+
+def _parse_shortcuts(lnk_paths: Iterable[str]) -> Tuple[Dict[str, str], List[str]]:
+    """Resolve what can be read directly from the files.
+    Returns (lnk -> exe for valid .exe targets, remaining lnk paths).
+    """
+    out: Dict[str, str] = {}
+    rest: List[str] = []
+    for lnk in lnk_paths:
+        target = _parse_lnk(lnk)
+        if target and target.lower().endswith(".exe") and _isfile(target):
+            out[lnk] = target
+        else:
+            rest.append(lnk)
+    return out, rest
+
+
+# --- In-process .lnk resolution (IShellLinkW via ctypes) --------------------
+
+_CLSID_SHELL_LINK = "{00021401-0000-0000-C000-000000000046}"
+_IID_ISHELL_LINK_W = "{000214F9-0000-0000-C000-000000000046}"
+_IID_IPERSIST_FILE = "{0000010B-0000-0000-C000-000000000046}"
+_CLSCTX_INPROC_SERVER = 0x1
+_COINIT_APARTMENTTHREADED = 0x2
+_RPC_E_CHANGED_MODE = -2147417850  # 0x80010106
+_STGM_READ = 0x0
+_SLGP_UNCPRIORITY = 0x2
+
+
+def _guid(s: str):
+    return (ctypes.c_ubyte * 16).from_buffer_copy(uuid.UUID(s).bytes_le)
+
+
+# GUID 構造体はモジュール読み込み時に一度だけ作成して使い回す
+_GUID_CLSID_SHELL_LINK = _guid(_CLSID_SHELL_LINK)
+_GUID_IID_ISHELL_LINK_W = _guid(_IID_ISHELL_LINK_W)
+_GUID_IID_IPERSIST_FILE = _guid(_IID_IPERSIST_FILE)
+
+_com_state = threading.local()
+
+
+@contextmanager
+def _com_initialized():
+    """Initialize COM (STA) once per thread; nested scopes reuse it.
+    Yields False when COM is unavailable. Objects cached on _com_state
+    (e.g. the WScript.Shell dispatch) live only while the outermost scope is open.
+    """
+    depth = getattr(_com_state, "depth", 0)
+    if depth:
+        _com_state.depth = depth + 1
+        try:
+            yield _com_state.ok
+        finally:
+            _com_state.depth -= 1
+        return
+    ole32 = None
+    ok = False
+    need_uninit = False
+    if os.name == 'nt':
         try:
-            shell = win32com.client.Dispatch("WScript.Shell")  # type: ignore
-            shortcut = shell.CreateShortCut(path)
-            target = shortcut.TargetPath
-            if target and target.lower().endswith(".exe") and os.path.isfile(target):
-                return target
+            ole32 = ctypes.windll.ole32  # type: ignore[attr-defined]
+            hr_init = ole32.CoInitializeEx(None, _COINIT_APARTMENTTHREADED)
+            # S_OK/S_FALSE のときのみ対で CoUninitialize する（RPC_E_CHANGED_MODE は既存の初期化を流用）
+            ok = hr_init >= 0 or hr_init == _RPC_E_CHANGED_MODE
+            need_uninit = hr_init >= 0
         except Exception:
-            pass
+            ok = False
+    _com_state.depth = 1
+    _com_state.ok = ok
+    _com_state.wsh = None
+    try:
+        yield ok
+    finally:
+        _com_state.depth = 0
+        _com_state.wsh = None
+        if need_uninit and ole32 is not None:
+            ole32.CoUninitialize()
+
+
+def _com_method(obj: ctypes.c_void_p, index: int, restype, *argtypes):
+    """Return a callable for vtable slot `index` of a raw COM interface pointer."""
+    vtbl = ctypes.cast(obj, ctypes.POINTER(ctypes.POINTER(ctypes.c_void_p))).contents
+    return ctypes.WINFUNCTYPE(restype, ctypes.c_void_p, *argtypes)(vtbl[index])
+
+
+def _resolve_shortcuts_ctypes(lnk_paths: Iterable[str]) -> Optional[Dict[str, str]]:
+    """Resolve .lnk targets in-process with IShellLinkW + IPersistFile::Load.
+    One ShellLink instance is reused for every path. Returns None when COM is
+    unavailable so that callers can fall back to PowerShell.
+    """
+    with _com_initialized() as ok:
+        if not ok:
+            return None
+        return _resolve_shortcuts_com(ctypes.windll.ole32, lnk_paths)  # type: ignore[attr-defined]
+
+
+def _resolve_shortcuts_com(ole32, lnk_paths: Iterable[str]) -> Optional[Dict[str, str]]:
+    link = ctypes.c_void_p()
+    pf = ctypes.c_void_p()
+    try:
+        hr = ole32.CoCreateInstance(
+            ctypes.byref(_GUID_CLSID_SHELL_LINK), None, _CLSCTX_INPROC_SERVER,
+            ctypes.byref(_GUID_IID_ISHELL_LINK_W), ctypes.byref(link),
+        )
+        if hr < 0 or not link.value:
+            return None
+        query_interface = _com_method(link, 0, ctypes.c_long, ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p))
+        if query_interface(link, ctypes.byref(_GUID_IID_IPERSIST_FILE), ctypes.byref(pf)) < 0 or not pf.value:
+            return None
+        load = _com_method(pf, 5, ctypes.c_long, ctypes.c_wchar_p, ctypes.c_ulong)
+        get_path = _com_method(link, 3, ctypes.c_long, ctypes.c_wchar_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_ulong)
+        buf = ctypes.create_unicode_buffer(32768)
+        out: Dict[str, str] = {}
+        for lnk in lnk_paths:
+            try:
+                if load(pf, lnk, _STGM_READ) < 0:
+                    continue
+                # S_FALSE(1) はパスを持たないリンク
+                if get_path(link, buf, len(buf), None, _SLGP_UNCPRIORITY) != 0:
+                    continue
+                target = buf.value
+                if target and target.lower().endswith('.exe') and _isfile(target):
+                    out[lnk] = target
+            except Exception:
+                continue
+        return out
+    except Exception:
+        return None
+    finally:
+        for ptr in (pf, link):
+            if ptr.value:
+                try:
+                    _com_method(ptr, 2, ctypes.c_ulong)(ptr)
+                except Exception:
+                    pass
+
+
+def _resolve_lnk_target(path: str) -> Optional[str]:
+    """Resolve a single .lnk target (deprecated for bulk use).
+    Each call may spawn PowerShell; prefer _resolve_shortcuts_in_dir or
+    AppCandidate.target_exe from scan_start_menu(resolve_targets=True).
+    """
+    # Cheapest: read the target directly from the file
+    target = _parse_lnk(path)
+    if target and target.lower().endswith(".exe") and _isfile(target):
+        return target
+    with _com_initialized():
+        # Then try via pywin32 (WScript.Shell is dispatched once per COM scope)
+        client = _get_win32com()
+        if client is not None:
+            try:
+                shell = _com_state.wsh
+                if shell is None:
+                    shell = client.Dispatch("WScript.Shell")  # type: ignore
+                    _com_state.wsh = shell
+                shortcut = shell.CreateShortCut(path)
+                target = shortcut.TargetPath
+                if target and target.lower().endswith(".exe") and _isfile(target):
+                    return target
+            except Exception:
+                pass
+        # Next: in-process IShellLinkW (no pywin32 needed)
+        resolved = _resolve_shortcuts_ctypes([path])
+        if resolved is not None:
+            return resolved.get(path)
     # Fallback: use PowerShell to read shortcut target to support packaged envs
     try:
         # Force Unicode (UTF-16LE) output to avoid codepage issues
@@ -215,7 +641,7 @@ def _resolve_lnk_target(path: str) -> Optional[str]:
         out_bytes = cp.stdout or b""
         # Decode as UTF-16LE (Unicode)
         target = (out_bytes.decode('utf-16le', errors='ignore') if out_bytes else '').strip().strip('"')
-        if target and target.lower().endswith('.exe') and os.path.isfile(target):
+        if target and target.lower().endswith('.exe') and _isfile(target):
             return target
     except Exception:
         pass
@@ -223,20 +649,37 @@ def _resolve_lnk_target(path: str) -> Optional[str]:
 
 
 def _resolve_shortcuts_in_dir(root_dir: str) -> Dict[str, str]:
-    """Resolve all .lnk targets under a directory using a single PowerShell process.
+    """Resolve all .lnk targets under a directory (see _resolve_shortcuts_in_dirs)."""
+    return _resolve_shortcuts_in_dirs([root_dir])
+
+
+def _resolve_shortcuts_in_dirs(root_dirs: Iterable[str]) -> Dict[str, str]:
+    """Resolve all .lnk targets under the given directories in-process
+    (IShellLinkW), or with one PowerShell process covering every directory
+    when COM is unavailable.
     Returns mapping: lnk_path -> target_exe (only valid .exe existing on disk).
     """
-    if not root_dir or not os.path.isdir(root_dir):
+    dirs = [d for d in root_dirs if d and _isdir(d)]
+    if not dirs:
         return {}
+    # 1) ファイルを直接解析、2) 残りを in-process COM、3) COM 不可時のみ PowerShell
+    parsed, rest = _parse_shortcuts(itertools.chain.from_iterable(_iter_shortcuts(d) for d in dirs))
+    if not rest:
+        return parsed
+    resolved = _resolve_shortcuts_ctypes(rest)
+    if resolved is not None:
+        resolved.update(parsed)
+        return resolved
     # Build a PowerShell script and pass via -EncodedCommand (UTF-16LE base64)
-    dir_escaped = root_dir.replace("'", "''")
+    dirs_literal = ",".join("'{0}'".format(d.replace("'", "''")) for d in dirs)
     script = (
         "[Console]::OutputEncoding=[System.Text.Encoding]::UTF8; "
-        + "$dir = '{0}'; ".format(dir_escaped)
-        + "Get-ChildItem -LiteralPath $dir -Recurse -Filter *.lnk -ErrorAction SilentlyContinue | "
+        + "$dirs = @({0}); ".format(dirs_literal)
+        + "Get-ChildItem -LiteralPath $dirs -Recurse -Filter *.lnk -ErrorAction SilentlyContinue | "
         + "ForEach-Object { try { $s = (New-Object -ComObject WScript.Shell).CreateShortcut($_.FullName); "
         + "$t = $s.TargetPath; if ($t -and $t.ToLower().EndsWith('.exe') -and (Test-Path -LiteralPath $t)) { "
-        + "[PSCustomObject]@{ Lnk=$_.FullName; Target=$t } } } catch { } } | ConvertTo-Json -Compress"
+        # 1 件ごとに 1 行の JSON（NDJSON）で出力し、Python 側で逐次読み取る
+        + "[PSCustomObject]@{ Lnk=$_.FullName; Target=$t } | ConvertTo-Json -Compress } } catch { } }"
     )
     encoded = base64.b64encode(script.encode('utf-16le')).decode('ascii')
     args = [
@@ -247,57 +690,261 @@ def _resolve_shortcuts_in_dir(root_dir: str) -> Dict[str, str]:
         encoded,
     ]
     try:
-        res = _run_no_window(args, capture_output=True, timeout=15)
-        data = res.stdout.decode('utf-8', errors='ignore').strip()
-        if not data:
-            return {}
-        # ConvertTo-Json returns array or single object; normalize to list
-        obj = json.loads(data)
-        items = obj if isinstance(obj, list) else [obj]
-        out: Dict[str, str] = {}
-        for it in items:
-            try:
-                lnk = it.get('Lnk')
-                tgt = it.get('Target')
-                if lnk and tgt and tgt.lower().endswith('.exe') and os.path.isfile(tgt):
+        proc = _popen_no_window(args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    except Exception:
+        return parsed
+    # 全体の制限時間は従来どおり 15 秒。超えたら停止し、そこまでの結果を使う
+    killer = threading.Timer(15, proc.kill)
+    killer.start()
+    out: Dict[str, str] = {}
+    try:
+        with proc:
+            for raw in proc.stdout:
+                line = raw.decode('utf-8', errors='ignore').strip().lstrip('\ufeff')
+                if not line:
+                    continue
+                try:
+                    it = json.loads(line)
+                    lnk = it.get('Lnk')
+                    tgt = it.get('Target')
+                except Exception:
+                    continue
+                if lnk and tgt and tgt.lower().endswith('.exe') and _isfile(tgt):
                     out[lnk] = tgt
-            except Exception:
-                continue
-        return out
     except Exception:
-        return {}
+        pass
+    finally:
+        killer.cancel()
+    out.update(parsed)
+    return out
 
 
-def scan_start_menu(*, show_uninstallers: bool = False) -> List[AppCandidate]:
+def scan_start_menu(*, show_uninstallers: bool = False, resolve_targets: bool = False) -> Iterator[AppCandidate]:
     """Start menu shortcuts as candidates (use .lnk path itself).
     We keep resolution helpers for other uses, but list .lnk directly so that
     even PWA-style proxies appear as friendly shortcuts instead of raw exe.
+    With resolve_targets=True, all Start Menu roots are resolved in one batch
+    and the result is stored in AppCandidate.target_exe.
+    """
+    # リンク先は最初の yield より前にまとめて解決する（COM の初期化やメモは解決処理の中で完結させ、
+    # 中断中のジェネレータが COM のアパートメントやメモを保持しないようにする）
+    with _fs_memo():
+        present = _present_start_menu_dirs()
+        # 存在するフォルダが無ければ COM 初期化や PowerShell 起動も含めて何もしない
+        if not present:
+            return
+        targets = _resolve_shortcuts_in_dirs([d for _i, d in present]) if resolve_targets else None
+    for i, d in present:
+        yield from _scan_start_menu_dir(i, d, show_uninstallers=show_uninstallers, targets=targets)
+
+
+def _present_start_menu_dirs() -> List[Tuple[int, str]]:
+    """(index, dir) for START_MENU_DIRS entries that exist (index 0 is the system menu)."""
+    return [(i, d) for i, d in enumerate(START_MENU_DIRS) if d and _isdir(d)]
+
+
+def _scan_start_menu_dir(index: int, d: str, *, show_uninstallers: bool = False, targets: Optional[Dict[str, str]] = None) -> Iterator[AppCandidate]:
+    """Scan a single START_MENU_DIRS entry (index 0 is the system menu).
+    targets is a pre-resolved lnk -> exe mapping (see _resolve_shortcuts_in_dirs).
     """
-    results: List[AppCandidate] = []
-    for i, d in enumerate(START_MENU_DIRS):
-        src = "startmenu_system" if i == 0 else "startmenu_user"
-        if not d or not os.path.isdir(d):
+    src = "startmenu_system" if index == 0 else "startmenu_user"
+    if not d or not _isdir(d):
+        return
+    if targets is None:
+        targets = {}
+    for e in _iter_lnk_entries(d):
+        lnk = e.path
+        # 拡張子は _iter_lnk_entries で .lnk と確認済みのため、splitext/basename を使わず切り出す
+        name = e.name[:-4]
+        # .lnk 名がアンインストーラっぽい場合は除外（許可時は通す）
+        if (not show_uninstallers) and (_matches_uninstaller(name) or _matches_uninstaller(e.name)):
             continue
-        for base, _dirs, files in os.walk(d):
-            for fn in files:
-                if not fn.lower().endswith(".lnk"):
-                    continue
-                lnk = os.path.join(base, fn)
-                name = os.path.splitext(fn)[0]
-                # .lnk 名がアンインストーラっぽい場合は除外（許可時は通す）
-                if (not show_uninstallers) and (_looks_uninstaller(name) or _looks_uninstaller(lnk)):
+        yield AppCandidate(name=name, exe_path=lnk, source=src, target_exe=targets.get(lnk))
+
+
+def _dedup_key(p: str) -> str:
+    # レジストリ/スタートメニュー由来は絶対パスのため getcwd を伴う abspath を省く
+    return p.lower() if os.path.isabs(p) else os.path.normcase(os.path.abspath(p))
+
+
+def _scan_all_uncached(dedup: bool = True, *, show_uninstallers: bool = False, resolve_targets: bool = False) -> List[AppCandidate]:
+    with _fs_memo():
+        return _scan_all_sources(dedup, show_uninstallers=show_uninstallers, resolve_targets=resolve_targets)
+
+
+def _scan_all_sources(dedup: bool, *, show_uninstallers: bool, resolve_targets: bool) -> List[AppCandidate]:
+    # レジストリ/ファイルシステム/PowerShell 待ちが中心のため、各ソースをスレッドで並列に走査
+    present = _present_start_menu_dirs()
+    # スタートメニューが 1 つも無い環境ではリンク先解決（PowerShell 起動）自体を省く
+    resolve_targets = resolve_targets and bool(present)
+    n_jobs = len(UNINSTALL_REG_PATHS_WITH_SOURCE) + len(present) + (1 if resolve_targets else 0)
+    # 全ジョブを同時に走らせ、壁時計時間を最も遅いソース 1 つ分に抑える
+    with concurrent.futures.ThreadPoolExecutor(max_workers=n_jobs) as ex:
+        # リンク先は全スタートメニューをまとめて 1 回で解決し、後から割り当てる。
+        # PowerShell の起動待ちが最も長いため、最初に投入してレジストリ走査と重ねる
+        targets_future = ex.submit(_resolve_shortcuts_in_dirs, [d for _i, d in present]) if resolve_targets else None
+        # ジェネレータは各ワーカースレッド内で消費させる
+        futures = [
+            ex.submit(list, _scan_uninstall_hive(root, path, access, source, show_uninstallers=show_uninstallers, dedup=dedup))
+            for root, path, access, source in UNINSTALL_REG_PATHS_WITH_SOURCE
+        ] + [
+            ex.submit(list, _scan_start_menu_dir(i, d, show_uninstallers=show_uninstallers))
+            for i, d in present
+        ]
+        targets = targets_future.result() if targets_future is not None else None
+        # 提出順に取り込み、逐次実行時と同じ順序（重複時の優先順位）を保つ。
+        # 中間リストを作らず、取り込みと同時に重複を除く
+        out: List[AppCandidate] = []
+        seen: Dict[str, AppCandidate] = {}
+        for fut in futures:
+            for it in fut.result():
+                if targets is not None and it.source.startswith("startmenu"):
+                    it.target_exe = targets.get(it.exe_path)
+                if dedup:
+                    seen.setdefault(_dedup_key(it.exe_path), it)
+                else:
+                    out.append(it)
+    return list(seen.values()) if dedup else out
+
+
+# --- Scan cache (stale-while-revalidate) ------------------------------------
+
+_SCAN_CACHE_VERSION = 1
+_revalidate_lock = threading.Lock()
+
+
+def _scan_cache_path() -> str:
+    base = os.environ.get("LOCALAPPDATA") or os.environ.get("APPDATA") or os.path.expanduser("~")
+    return os.path.join(base, "ShortRun", "scan_cache.json")
+
+
+def _scan_fingerprint() -> str:
+    """Cheap change marker: mtimes of every Start Menu directory (recursive,
+    directories only) + LastWriteTime of each Uninstall key and its subkeys.
+    Only metadata is read (no values, no .lnk files), so it stays far cheaper
+    than a rescan. Returned as a digest to keep the cache file small.
+    """
+    h = hashlib.sha1()
+    for d in START_MENU_DIRS:
+        try:
+            h.update(f"{d}={os.stat(d).st_mtime_ns}\n".encode("utf-8", "surrogatepass"))
+        except OSError:
+            h.update(f"{d}=-\n".encode("utf-8", "surrogatepass"))
+            continue
+        # フォルダの mtime は直下の追加/削除/名前変更で変わるため、深い階層のショートカット追加も拾える
+        stack = [d]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for e in it:
+                        if e.is_dir(follow_symlinks=False):
+                            stack.append(e.path)
+                            h.update(f"{e.path}={e.stat(follow_symlinks=False).st_mtime_ns}\n".encode("utf-8", "surrogatepass"))
+            except OSError:
+                continue
+    for root, path, access in UNINSTALL_REG_PATHS:
+        # 既存エントリの値の変更は親キーの LastWriteTime に現れないため、サブキーごとに確認する
+        try:
+            with _open_key_children(root, path, access) as (parent, names):
+                if parent is None:
+                    h.update(f"{root}:{access}=-\n".encode())
                     continue
-                results.append(AppCandidate(name=name, exe_path=lnk, source=src))
-    return results
+                h.update(f"{root}:{access}={winreg.QueryInfoKey(parent)[2]}\n".encode())
+                for name in names:
+                    try:
+                        with winreg.OpenKey(parent, name, 0, winreg.KEY_READ | access) as sk:
+                            stamp = winreg.QueryInfoKey(sk)[2]
+                    except OSError:
+                        stamp = "-"
+                    h.update(f"{name}={stamp}\n".encode("utf-8", "surrogatepass"))
+        except OSError:
+            h.update(f"{root}:{access}=!\n".encode())
+    return h.hexdigest()
+
+
+def _load_scan_cache(options: Dict[str, bool]) -> Optional[Tuple[str, List[AppCandidate]]]:
+    try:
+        with open(_scan_cache_path(), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != _SCAN_CACHE_VERSION or data.get("options") != options:
+            return None
+        items = [AppCandidate(**it) for it in data.get("items", [])]
+        return (str(data.get("fingerprint", "")), items)
+    except Exception:
+        return None
 
 
-def scan_all(dedup: bool = True, *, show_uninstallers: bool = False) -> List[AppCandidate]:
-    items = scan_uninstall(show_uninstallers=show_uninstallers) + scan_start_menu(show_uninstallers=show_uninstallers)
-    if not dedup:
-        return items
-    seen: Dict[str, AppCandidate] = {}
-    for it in items:
-        key = os.path.normcase(os.path.abspath(it.exe_path))
-        if key not in seen:
-            seen[key] = it
-    return list(seen.values())
+def _save_scan_cache(options: Dict[str, bool], fingerprint: str, items: List[AppCandidate]) -> None:
+    path = _scan_cache_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = {
+            "version": _SCAN_CACHE_VERSION,
+            "options": options,
+            "fingerprint": fingerprint,
+            "items": [dataclasses.asdict(it) for it in items],
+        }
+        # 書き込み途中で終了しても壊れたキャッシュが残らないよう、一時ファイルから置き換える
+        # （同時に動く別プロセスと衝突しないよう一時ファイル名に pid を含める）
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp, path)
+        except Exception:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+    except Exception:
+        pass
+
+
+def _rescan_and_store(options: Dict[str, bool]) -> List[AppCandidate]:
+    items = _scan_all_uncached(**options)
+    # 走査後に採取する（走査中の変更は次回の再検証で拾われる）
+    _save_scan_cache(options, _scan_fingerprint(), items)
+    return items
+
+
+def _revalidate_in_background(options: Dict[str, bool], cached_fp: str, on_update: Optional[Callable[[List[AppCandidate]], None]] = None) -> None:
+    # 再検証は同時に 1 本まで
+    if not _revalidate_lock.acquire(blocking=False):
+        return
+
+    def _work():
+        try:
+            # フィンガープリントの採取も呼び出し元を待たせないようこちらで行う
+            if _scan_fingerprint() == cached_fp:
+                return
+            items = _rescan_and_store(options)
+            if on_update is not None:
+                on_update(items)
+        except Exception:
+            pass
+        finally:
+            _revalidate_lock.release()
+
+    try:
+        threading.Thread(target=_work, daemon=True).start()
+    except Exception:
+        _revalidate_lock.release()
+
+
+def scan_all(dedup: bool = True, *, show_uninstallers: bool = False, resolve_targets: bool = False, use_cache: bool = False, refresh: bool = False, on_update: Optional[Callable[[List[AppCandidate]], None]] = None) -> List[AppCandidate]:
+    """Collect candidates from all sources.
+    With use_cache=True the previous result is returned from disk right away,
+    and a background thread checks the fingerprint; if anything changed it
+    rescans, refreshes the cache and calls on_update(items) from that thread.
+    refresh=True (with use_cache) always rescans and stores the fresh result.
+    """
+    options = {"dedup": dedup, "show_uninstallers": show_uninstallers, "resolve_targets": resolve_targets}
+    if not use_cache:
+        return _scan_all_uncached(**options)
+    cached = None if refresh else _load_scan_cache(options)
+    if cached is None:
+        return _rescan_and_store(options)
+    cached_fp, items = cached
+    _revalidate_in_background(options, cached_fp, on_update)
+    return items
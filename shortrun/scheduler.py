@@ -1,22 +1,35 @@
 from __future__ import annotations
+import atexit
 import datetime as dt
 import csv
+import functools
+import io
 import os
 import re
 import subprocess
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
 import concurrent.futures
 import tempfile
+import threading
+import time
+import xml.etree.ElementTree as ET
 
 _TASK_PREFIX = "ShortRun_"
+_R = TypeVar("_R")
 _alias_re = re.compile(r"[^A-Za-z0-9_-]+")
 
+# サフィックス（日時や曜日の組み合わせ）も通るため、別名より多めに保持する
+@functools.lru_cache(maxsize=1024)
 def _sanitize(s: str) -> str:
+    # 英数字と - _ だけの別名（大半）は置換不要なので正規表現を通さない
+    if s.isascii() and s.replace("-", "").replace("_", "").isalnum():
+        return s[:60]
     s = s.strip()
     s = _alias_re.sub("_", s)
     return s[:60]
 
 
+@functools.lru_cache(maxsize=256)
 def _task_name(alias: str, kind: str, suffix: Optional[str] = None) -> str:
     name = f"{_TASK_PREFIX}{_sanitize(alias)}_{kind}"
     if suffix:
@@ -24,78 +37,447 @@ def _task_name(alias: str, kind: str, suffix: Optional[str] = None) -> str:
     return name
 
 
+@functools.lru_cache(maxsize=256)
 def _quote(path: str) -> str:
     # schtasks の /TR に渡す文字列は二重引用符で囲む
     p = path.strip().strip('"')
     return f'"{p}"'
 
 
-def _run(cmd: List[str]) -> subprocess.CompletedProcess:
-    """サブプロセス実行（Windowsではコンソールを出さない）。"""
-    kwargs = dict(capture_output=True, text=True, shell=False)
-    if os.name == 'nt':
-        # コンソールの点滅防止
-        try:
-            si = subprocess.STARTUPINFO()
-            si.dwFlags |= getattr(subprocess, 'STARTF_USESHOWWINDOW', 0)
-            si.wShowWindow = 0  # SW_HIDE
-        except Exception:
-            si = None
-        creationflags = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
-        kwargs.update(startupinfo=si, creationflags=creationflags)
-    return subprocess.run(cmd, **kwargs)
+def _make_startupinfo():
+    try:
+        si = subprocess.STARTUPINFO()  # type: ignore[attr-defined]
+        si.dwFlags |= getattr(subprocess, 'STARTF_USESHOWWINDOW', 0)
+        si.wShowWindow = 0  # SW_HIDE
+        return si
+    except Exception:
+        return None
+
+
+# 呼び出しごとに作らずモジュール読み込み時に 1 度だけ用意する
+# （Popen は渡された STARTUPINFO をコピーして使うため共有しても安全）
+_SI = _make_startupinfo() if os.name == 'nt' else None
+_CFLAGS = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+# _run の引数一式も読み込み時に組み立てておく（Windows ではコンソールの点滅防止付き）
+# 想定外のバイト列で UnicodeDecodeError にならないよう errors="replace" で復号する
+_RUN_KWARGS = dict(capture_output=True, text=True, errors="replace", shell=False)
+# 出力を使わない呼び出し用（復号も行わない）
+_QUIET_KWARGS = dict(stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, shell=False)
+# 出力を逐次読むための Popen 用（stderr は使わないので捨てる）
+_STREAM_KWARGS = dict(stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, errors="replace", shell=False)
+if os.name == 'nt':
+    for _kw in (_RUN_KWARGS, _QUIET_KWARGS, _STREAM_KWARGS):
+        _kw.update(startupinfo=_SI, creationflags=_CFLAGS)
+    del _kw
+
+
+# list_tasks の結果を短時間だけ保持する（UI からの連続呼び出しで schtasks/COM を再実行しない）
+_LIST_CACHE_TTL = 2.0
+# キー: (小文字化した author または None, 事前に絞り込んだ名前の接頭辞または None)
+_list_cache: Dict[Tuple[Optional[str], Optional[str]], Tuple[float, List[Dict[str, str]]]] = {}
+_list_cache_lock = threading.Lock()
+_list_cache_gen = 0
+_MUTATING_VERBS = {"/Create", "/Delete", "/Change"}
+
+
+# author 確認や一括削除で使うスレッドプール（呼び出しごとに作り直さず使い回す）
+_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> concurrent.futures.ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=max(2, min(8, (os.cpu_count() or 4))),
+                thread_name_prefix="shortrun-sched",
+            )
+            atexit.register(_pool.shutdown, wait=False)
+        return _pool
+
+
+def _invalidate_list_cache() -> None:
+    global _list_cache_gen
+    with _list_cache_lock:
+        _list_cache.clear()
+        _xml_cache.clear()
+        _list_cache_gen += 1
+
+
+def _run(cmd: List[str], *, capture: bool = True) -> subprocess.CompletedProcess:
+    """サブプロセス実行（Windowsではコンソールを出さない）。
+    capture=False の場合は出力を捨てる（returncode のみ有効）。
+    """
+    mutating = len(cmd) > 1 and cmd[1] in _MUTATING_VERBS
+    if mutating:
+        # タスクを変更するコマンドは一覧キャッシュを無効化（実行中に始まった一覧取得の結果も
+        # 変更前の可能性があるため、完了後にもう一度無効化する）
+        _invalidate_list_cache()
+    try:
+        return subprocess.run(cmd, **(_RUN_KWARGS if capture else _QUIET_KWARGS))
+    finally:
+        if mutating:
+            _invalidate_list_cache()
 
 
-def _ensure_author(task_name: str, author: str = "ShortRun") -> None:
-    """Ensure the task has the given Author in its XML. Best-effort.
-    Reads the XML, patches <RegistrationInfo><Author>, recreates the task.
+# タスク XML の読み書き用（呼び出しごとのパターン解決を避けるため事前コンパイル）
+_author_re = re.compile(r"<Author>(.*?)</Author>", re.S)
+_reginfo_open_re = re.compile(r"<RegistrationInfo>\s*")
+_author_or_enabled_re = re.compile(r"<(Author|Enabled)>(.*?)</\1>", re.S | re.I)
+_settings_block_re = re.compile(r"<Settings\b[^>]*>(.*?)</Settings>", re.S | re.I)
+
+
+# strptime や正規表現を使わず、分割と桁チェックだけで検証する
+# （strptime と同様に 1 桁の時/分/月/日も受け付ける）
+def _digits(s: str, lo: int, hi: int) -> bool:
+    # isdigit は全角数字なども真になるため ASCII に限定する
+    return lo <= len(s) <= hi and s.isascii() and s.isdigit()
+
+
+def _is_hhmm(s: str) -> bool:
+    h, sep, m = s.partition(":")
+    return bool(sep) and _digits(h, 1, 2) and _digits(m, 1, 2) and int(h) < 24 and int(m) < 60
+
+
+def _is_ymd(s: str) -> bool:
+    parts = s.split("/")
+    if len(parts) != 3:
+        return False
+    y, mo, d = parts
+    if not (_digits(y, 4, 4) and _digits(mo, 1, 2) and _digits(d, 1, 2)):
+        return False
+    try:
+        # 月ごとの日数（うるう年含む）は date に任せる
+        dt.date(int(y), int(mo), int(d))
+    except ValueError:
+        return False
+    return True
+
+
+def _is_du(s: str) -> bool:
+    """HHHH:MM or HHHH:MM:SS as accepted by schtasks /DU."""
+    parts = s.split(":")
+    return (
+        len(parts) in (2, 3)
+        and _digits(parts[0], 1, 4)
+        and all(_digits(p, 2, 2) for p in parts[1:])
+    )
+
+
+def _validate_hhmm(hhmm: str) -> None:
+    if not _is_hhmm(hhmm):
+        raise ValueError("時刻は HH:MM 形式で指定してください")
+
+
+_TASK_NS = "http://schemas.microsoft.com/windows/2004/02/mit/task"
+_T = "{" + _TASK_NS + "}"
+# 再シリアライズ時に ns0: 接頭辞が付かないよう既定名前空間として登録
+ET.register_namespace("", _TASK_NS)
+
+
+def _set_author_xml(xml: str, author: str) -> str:
+    """Insert or replace <RegistrationInfo><Author> in a task XML string (regex fallback)."""
+    m = _author_re.search(xml)
+    if m:
+        if m.group(1).strip() == author:
+            return xml
+        return _author_re.sub(f"<Author>{author}</Author>", xml)
+    # Try to inject under <RegistrationInfo>
+    return _reginfo_open_re.sub(f"<RegistrationInfo><Author>{author}</Author>", xml, count=1)
+
+
+def _set_author_el(root: ET.Element, author: str) -> bool:
+    """Set Author on a parsed task; returns True if the tree changed."""
+    reg = root.find(_T + "RegistrationInfo")
+    if reg is None:
+        reg = ET.Element(_T + "RegistrationInfo")
+        root.insert(0, reg)
+    el = reg.find(_T + "Author")
+    if el is None:
+        el = ET.Element(_T + "Author")
+        reg.insert(0, el)
+    elif (el.text or "").strip() == author:
+        return False
+    el.text = author
+    return True
+
+
+def _apply_task_xml_edits(xml: str, *, author: Optional[str] = None) -> str:
+    """Parse once, apply every edit to the tree and serialize once.
+    Returns xml unchanged when nothing needed editing.
+    """
+    # 既に目的の Author を持つ XML（通常の再編集時）は解析せずにそのまま返す
+    if author is None or f"<Author>{author}</Author>" in xml:
+        return xml
+    try:
+        root = ET.fromstring(xml)
+    except ET.ParseError:
+        # 解析できない場合は従来の文字列置換で対応
+        return _set_author_xml(xml, author) if author is not None else xml
+    changed = False
+    if author is not None:
+        changed |= _set_author_el(root, author)
+    if not changed:
+        return xml
+    # 宣言の encoding は書き出す一時ファイル（UTF-16）に合わせて明示する
+    return '<?xml version="1.0" encoding="UTF-16"?>\n' + ET.tostring(root, encoding="unicode")
+
+
+# schtasks /XML はファイルしか受け付けないため、プロセスごとに固定の一時ファイルを
+# 上書きして使い回す（毎回一意なファイルを作成・削除しない）。書き込みと /Create は排他
+_TASK_XML_TMP = os.path.join(tempfile.gettempdir(), f"shortrun_task_{os.getpid()}.xml")
+_task_xml_lock = threading.Lock()
+# O_SHORT_LIVED（Windows のみ）は FILE_ATTRIBUTE_TEMPORARY 付きで作成し、可能な限りディスクへ書き出さない。
+# O_BINARY が無いと CRT のテキストモードで LF の前に CR が挿入され、UTF-16 が壊れる
+_TASK_XML_TMP_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    | getattr(os, "O_BINARY", 0) | getattr(os, "O_SHORT_LIVED", 0)
+)
+
+
+def _create_from_xml(task_name: str, xml: str) -> subprocess.CompletedProcess:
+    """schtasks /Create /XML /F using the per-process scratch file."""
+    with _task_xml_lock:
+        # schtasks が /Query /XML で出力するのと同じ BOM 付き UTF-16 で書き出す
+        # （エクスポートした XML の encoding="UTF-16" 宣言ともそのまま一致する）
+        with open(os.open(_TASK_XML_TMP, _TASK_XML_TMP_FLAGS, 0o600), "w", encoding="utf-16") as f:
+            f.write(xml)
+        return _run(["schtasks", "/Create", "/TN", task_name, "/XML", _TASK_XML_TMP, "/F"])
+
+
+@atexit.register
+def _remove_task_xml_tmp() -> None:
+    try:
+        os.remove(_TASK_XML_TMP)
+    except Exception:
+        pass
+
+
+def _patch_task_xml(task_name: str, *, author: Optional[str] = None) -> None:
+    """Apply every requested XML edit with one /Query /XML and at most one
+    /Create /XML round-trip. Best-effort; skips the re-create when nothing changed.
     """
     try:
         cp = _run(["schtasks", "/Query", "/TN", task_name, "/XML"])
         if cp.returncode != 0 or not cp.stdout:
             return
         xml = cp.stdout
-        # Insert or replace Author
-        if "<Author>" in xml:
-            new_xml = re.sub(r"<Author>.*?</Author>", f"<Author>{author}</Author>", xml, flags=re.S)
-        else:
-            # Try to inject under <RegistrationInfo>
-            new_xml = re.sub(r"<RegistrationInfo>\s*", f"<RegistrationInfo><Author>{author}</Author>", xml, count=1)
-        if not new_xml:
+        # 編集はすべて 1 回の解析結果に適用し、再作成は最後に 1 回だけ
+        new_xml = _apply_task_xml_edits(xml, author=author)
+        if not new_xml or new_xml == xml:
+            # 既に一致していれば再作成（一時ファイル + /Create）は不要
             return
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".xml", mode="w", encoding="utf-8") as f:
-            f.write(new_xml)
-            tmp = f.name
-        try:
-            _run(["schtasks", "/Create", "/TN", task_name, "/XML", tmp, "/F"])
-        finally:
-            try:
-                os.remove(tmp)
-            except Exception:
-                pass
+        _create_from_xml(task_name, new_xml)
     except Exception:
         # Best-effort; ignore
         pass
 
 
+def _with_task_service(fn: Callable[[object], _R]) -> Optional[_R]:
+    """Call fn with the Task Scheduler COM service object (Schedule.Service).
+    Returns None when pywin32 or the service is unavailable, or fn raised.
+    COM references made inside fn are released before CoUninitialize.
+    """
+    try:
+        import pythoncom  # type: ignore
+        import win32com.client  # type: ignore
+    except Exception:
+        return None
+    try:
+        pythoncom.CoInitialize()
+    except Exception:
+        return None
+    try:
+        return fn(win32com.client.Dispatch("Schedule.Service"))
+    except Exception:
+        return None
+    finally:
+        pythoncom.CoUninitialize()
+
+
+# TASK_CREATION.TASK_UPDATE（既存タスクの定義を置き換える）
+_TASK_UPDATE = 4
+
+
+def _set_author_com(task_name: str, author: str) -> bool:
+    """Set RegistrationInfo/Author in-process via COM. Returns False when COM
+    could not be used so the caller can fall back to the XML round-trip.
+    """
+    def _update(svc) -> bool:
+        svc.Connect()
+        folder = svc.GetFolder("\\")
+        td = folder.GetTask(task_name).Definition
+        if (td.RegistrationInfo.Author or "") != author:
+            td.RegistrationInfo.Author = author
+            # 既存のプリンシパル（ユーザー・ログオン種別）のまま更新する
+            folder.RegisterTaskDefinition(
+                task_name, td, _TASK_UPDATE, None, None, td.Principal.LogonType
+            )
+        return True
+
+    if not _with_task_service(_update):
+        return False
+    _invalidate_list_cache()
+    return True
+
+
+def _ensure_author(task_name: str, author: str = "ShortRun") -> None:
+    """Ensure the task has the given Author in its XML. Best-effort."""
+    # COM が使えればプロセスを起動せずに更新し、使えない場合だけ XML を再登録する
+    if _set_author_com(task_name, author):
+        return
+    _patch_task_xml(task_name, author=author)
+
+
+def _create_task(name: str, cmd: List[str]) -> None:
+    """Run a schtasks /Create command, then apply the post-create XML patches."""
+    cp = _run(cmd)
+    if cp.returncode != 0:
+        raise RuntimeError(cp.stderr or cp.stdout)
+    # 作成後の XML 修正はここにまとめ、/Query と /Create /XML は各 1 回に抑える
+    _ensure_author(name)
+
+
+def _task_meta_from_el(task: ET.Element) -> Tuple[Optional[str], Optional[bool]]:
+    """(Author, Enabled) from a parsed <Task>. Enabled is the task's own
+    <Settings><Enabled>, falling back to the first <Enabled> anywhere.
+    """
+    a_el = task.find(_T + "RegistrationInfo/" + _T + "Author")
+    e_el = task.find(_T + "Settings/" + _T + "Enabled")
+    if e_el is None:
+        e_el = task.find(".//" + _T + "Enabled")
+    author = (a_el.text or "").strip() if a_el is not None else None
+    enabled = (e_el.text or "").strip().lower() == "true" if e_el is not None else None
+    return (author, enabled)
+
+
+def _scan_author_or_enabled(text: str, need_enabled: bool = True) -> Tuple[Optional[str], Optional[bool]]:
+    # 1 回の走査で両方を拾い、揃った時点で打ち切る（いずれも最初の出現を採用）
+    author: Optional[str] = None
+    enabled: Optional[bool] = None
+    for m in _author_or_enabled_re.finditer(text):
+        tag = m.group(1).lower()
+        if tag == "author":
+            if author is None:
+                author = m.group(2).strip()
+        elif enabled is None:
+            val = m.group(2).strip().lower()
+            if val in ("true", "false"):
+                enabled = val == "true"
+        if author is not None and (enabled is not None or not need_enabled):
+            break
+    return (author, enabled)
+
+
+def _parse_author_and_enabled(xml: str) -> Tuple[Optional[str], Optional[bool]]:
+    # 1 回の構造解析で必要な要素だけを参照する。解析できない場合のみ正規表現で拾う
+    try:
+        return _task_meta_from_el(ET.fromstring(xml))
+    except ET.ParseError:
+        pass
+    # 構造解析と同じく Enabled は <Settings> 内のものを優先し、無ければ最初の出現を採用する
+    settings_m = _settings_block_re.search(xml)
+    enabled = _scan_author_or_enabled(settings_m.group(1))[1] if settings_m else None
+    author, first_enabled = _scan_author_or_enabled(xml, need_enabled=enabled is None)
+    if enabled is None:
+        enabled = first_enabled
+    return (author, enabled)
+
+
+# タスク単位の /Query /XML 結果（読み取り専用の確認用）。一覧キャッシュと同じ TTL・無効化に従い、
+# 同じタスクへの同時問い合わせは 1 回の実行にまとめる
+_xml_cache: Dict[str, Tuple[float, Optional[str]]] = {}
+_xml_inflight: Dict[str, concurrent.futures.Future] = {}
+
+
+def _query_task_xml(task_name: str) -> Optional[str]:
+    now = time.monotonic()
+    with _list_cache_lock:
+        hit = _xml_cache.get(task_name)
+        if hit is not None and now - hit[0] < _LIST_CACHE_TTL:
+            return hit[1]
+        fut = _xml_inflight.get(task_name)
+        owner = fut is None
+        if owner:
+            fut = concurrent.futures.Future()
+            _xml_inflight[task_name] = fut
+        gen = _list_cache_gen
+    if not owner:
+        return fut.result()
+    xml: Optional[str] = None
+    try:
+        cp = _run(["schtasks", "/Query", "/TN", task_name, "/XML"])
+        if cp.returncode == 0 and cp.stdout:
+            xml = cp.stdout
+    except Exception:
+        xml = None
+    finally:
+        with _list_cache_lock:
+            _xml_inflight.pop(task_name, None)
+            if gen == _list_cache_gen:
+                # 書き込み時に期限切れのものを捨てる
+                for k in [k for k, (ts, _x) in _xml_cache.items() if now - ts >= _LIST_CACHE_TTL]:
+                    del _xml_cache[k]
+                _xml_cache[task_name] = (now, xml)
+        fut.set_result(xml)
+    return xml
+
+
 def _get_author_and_enabled(task_name: str) -> Tuple[Optional[str], Optional[bool]]:
     """Return (Author, Enabled) by querying the task XML."""
+    xml = _query_task_xml(task_name)
+    if not xml:
+        return (None, None)
     try:
-        cp = _run(["schtasks", "/Query", "/TN", task_name, "/XML"])
-        if cp.returncode != 0 or not cp.stdout:
-            return (None, None)
-        xml = cp.stdout
-        m_a = re.search(r"<Author>(.*?)</Author>", xml, flags=re.S)
-        author = m_a.group(1).strip() if m_a else None
-        m_e = re.search(r"<Enabled>(true|false)</Enabled>", xml, flags=re.I)
-        enabled = None
-        if m_e:
-            enabled = m_e.group(1).lower() == "true"
-        return (author, enabled)
+        return _parse_author_and_enabled(xml)
     except Exception:
         return (None, None)
 
 
+# /XML ONE の出力では各 <Task> の直前に <!-- \タスクパス --> が入る
+_task_xml_block_re = re.compile(r"<!--\s*(\\[^>]*?)\s*-->\s*(<Task\b.*?</Task>)", re.S)
+
+
+def _iter_task_meta(dump: str) -> Iterator[Tuple[str, Tuple[Optional[str], Optional[bool]]]]:
+    """Stream-parse a /XML ONE dump, yielding (TaskName, (Author, Enabled)).
+    Each <Task> is cleared after reading so memory stays bounded.
+    """
+    name: Optional[str] = None
+    for event, el in ET.iterparse(io.StringIO(dump), events=("comment", "end")):
+        if event == "comment":
+            name = (el.text or "").strip().lstrip('\\')
+            continue
+        if el.tag != _T + "Task":
+            continue
+        if name:
+            yield (name, _task_meta_from_el(el))
+        name = None
+        el.clear()
+
+
+def _query_all_task_meta() -> Dict[str, Tuple[Optional[str], Optional[bool]]]:
+    """(Author, Enabled) of every task from one schtasks call: {TaskName: meta}.
+    TaskName has the leading backslash stripped, as in list_tasks.
+    """
+    try:
+        cp = _run(["schtasks", "/Query", "/XML", "ONE"])
+        if cp.returncode != 0 or not cp.stdout:
+            return {}
+        dump = cp.stdout
+    except Exception:
+        return {}
+    try:
+        return dict(_iter_task_meta(dump))
+    except ET.ParseError:
+        # 解析できない出力は従来どおりコメント区切りの正規表現で分割する
+        return {
+            m.group(1).lstrip('\\'): _parse_author_and_enabled(m.group(2))
+            for m in _task_xml_block_re.finditer(dump)
+        }
+
+
 def _append_schedule_window(cmd: List[str], *, sd: Optional[str] = None, ed: Optional[str] = None, et: Optional[str] = None, du: Optional[str] = None) -> None:
     """任意の開始日/終了日/終了時刻/期間をコマンドへ追加する。
     - sd: YYYY/MM/DD or YYYY-MM-DD
@@ -106,61 +488,175 @@ def _append_schedule_window(cmd: List[str], *, sd: Optional[str] = None, ed: Opt
     if sd:
         s = sd.replace('-', '/')
         # 最低限の形式チェック
-        try:
-            dt.datetime.strptime(s, "%Y/%m/%d")
+        if _is_ymd(s):
             cmd.extend(["/SD", s])
-        except ValueError:
-            pass
     if ed:
         e = ed.replace('-', '/')
-        try:
-            dt.datetime.strptime(e, "%Y/%m/%d")
+        if _is_ymd(e):
             cmd.extend(["/ED", e])
-        except ValueError:
-            pass
     if et:
         # HH:MM を想定、緩めに受け入れ
-        try:
-            dt.datetime.strptime(et, "%H:%M")
+        if _is_hhmm(et):
             cmd.extend(["/ET", et])
-        except ValueError:
-            pass
     if du:
         # 形式は環境依存のため簡易受け入れのみ
-        if re.match(r"^\d{1,4}:\d{2}(:\d{2})?$", du):
+        if _is_du(du):
             cmd.extend(["/DU", du])
 
 
+# COM と CSV のどちらで取得しても同じ表示になるよう、Status と次回実行時刻は
+# 日本語版 schtasks の出力（"準備完了"、"2024/01/05 9:00:00"）に揃える
+# IRegisteredTask.State -> Status
+_TASK_STATES = {0: "不明", 1: "無効", 2: "キューに登録済み", 3: "準備完了", 4: "実行中"}
+# 英語版 schtasks の Status -> 同じ表示（それ以外の値はそのまま使う）
+_CSV_STATUS_LABELS = {"unknown": "不明", "disabled": "無効", "queued": "キューに登録済み", "ready": "準備完了", "running": "実行中"}
+# GetTasks の flags（TASK_ENUM_HIDDEN を付けず、schtasks /Query と同じく隠しタスクは含めない）
+_TASK_ENUM_FLAGS = 0
+
+# (TaskName, Next Run Time, Status, (Author, Enabled) or None if unknown)
+_TaskRow = Tuple[str, str, str, Optional[Tuple[Optional[str], Optional[bool]]]]
+
+
+def _format_run_time(v) -> str:
+    return f"{v.year}/{v.month:02d}/{v.day:02d} {v.hour}:{v.minute:02d}:{v.second:02d}"
+
+
+def _format_next_run(v) -> str:
+    try:
+        # 次回実行なしは 1899/12/30 (COM の日付 0) で返る
+        if v is None or v.year < 1900:
+            return "N/A"
+        return _format_run_time(v)
+    except Exception:
+        return str(v or "")
+
+
+def _normalize_csv_next_run(s: str) -> str:
+    # 英語版 (en-US) の "1/5/2024 9:00:00 AM" だけ変換し、他のロケールの表記はそのまま使う
+    try:
+        return _format_run_time(dt.datetime.strptime(s.strip(), "%m/%d/%Y %I:%M:%S %p"))
+    except ValueError:
+        return s
+
+
+def _collect_task_rows(folder, rows: List[_TaskRow], *, recurse: bool) -> None:
+    for t in folder.GetTasks(_TASK_ENUM_FLAGS):
+        meta = None
+        if recurse:
+            # Author 指定時のみ必要なので、定義の取得もそのときだけ行う
+            try:
+                a = t.Definition.RegistrationInfo.Author
+            except Exception:
+                a = None
+            meta = ((a or None), bool(t.Enabled))
+        rows.append((
+            str(t.Path).lstrip('\\'),
+            _format_next_run(t.NextRunTime),
+            _TASK_STATES.get(int(t.State), ""),
+            meta,
+        ))
+    if recurse:
+        for sub in folder.GetFolders(0):
+            # Microsoft 配下は対象外（ルート直下の \Microsoft フォルダごと飛ばす）
+            if str(sub.Path).lower() == "\\microsoft":
+                continue
+            _collect_task_rows(sub, rows, recurse=True)
+
+
+def _query_rows_com(*, recurse: bool) -> Optional[List[_TaskRow]]:
+    """Enumerate tasks via the Task Scheduler COM API (Schedule.Service).
+    Returns None when pywin32 or the service is unavailable so the caller can
+    fall back to schtasks.
+    """
+    def _collect(svc) -> List[_TaskRow]:
+        svc.Connect()
+        rows: List[_TaskRow] = []
+        _collect_task_rows(svc.GetFolder("\\"), rows, recurse=recurse)
+        return rows
+
+    return _with_task_service(_collect)
+
+
+def _query_rows_csv() -> Optional[List[_TaskRow]]:
+    # 出力全体を溜めてから分割せず、届いた行から 1 つの csv.reader で読む
+    try:
+        proc = subprocess.Popen(["schtasks", "/Query", "/FO", "CSV", "/NH"], **_STREAM_KWARGS)
+    except OSError:
+        return None
+    with proc:
+        try:
+            # 事前に配列へ溜めるのは author 指定時の並列処理のため
+            rows: List[_TaskRow] = [
+                (
+                    p[0].strip().lstrip('\\'),
+                    _normalize_csv_next_run(p[1]) if len(p) > 1 else '',
+                    _CSV_STATUS_LABELS.get(p[2].strip().lower(), p[2]) if len(p) > 2 else '',
+                    None,
+                )
+                for p in csv.reader(proc.stdout)
+                if p and p[0].strip()
+            ]
+        except csv.Error:
+            proc.kill()
+            return None
+    if proc.returncode != 0:
+        return None
+    return rows
+
+
 def list_tasks(alias: Optional[str] = None, *, author: Optional[str] = None) -> List[Dict[str, str]]:
     """タスク一覧を取得。
     - デフォルトは ShortRun_ プレフィックスのタスクのみを対象
     - author を指定した場合は、作成者（Author）が一致するタスクを対象にする
-    いずれも簡易3列（TaskName, Next Run Time, Status）をCSVで取得し、
-    author 指定時は XML から Author/Enabled を補完する。
+    Task Scheduler の COM API で列挙し、使えない環境では schtasks の
+    簡易3列（TaskName, Next Run Time, Status）CSV にフォールバックする。
+    CSV の場合、author 指定時は XML から Author/Enabled を補完する。
     """
-    cp = _run(["schtasks", "/Query", "/FO", "CSV", "/NH"])
-    if cp.returncode != 0:
+    author_key = author.strip().lower() if author is not None else None
+    prefix = _TASK_PREFIX + _sanitize(alias) if alias is not None else None
+    # author 指定時は XML 確認が高価なため、alias があれば確認前に名前で絞り込む。
+    # 絞り込んだ結果は (author, prefix) をキーに別枠でキャッシュする
+    narrow = prefix if author is not None else None
+    now = time.monotonic()
+    with _list_cache_lock:
+        hit = _list_cache.get((author_key, None))
+        if (hit is None or now - hit[0] >= _LIST_CACHE_TTL) and narrow is not None:
+            hit = _list_cache.get((author_key, narrow))
+        gen = _list_cache_gen
+    if hit is not None and now - hit[0] < _LIST_CACHE_TTL:
+        results = hit[1]
+    else:
+        results = _list_tasks_uncached(author, narrow)
+        with _list_cache_lock:
+            # 取得中に変更があった場合は古い可能性があるので保存しない
+            if gen == _list_cache_gen:
+                _list_cache[(author_key, narrow)] = (now, results)
+    # 追加の alias フィルタ（指定時）はキャッシュ済みの一覧に対して Python 側で行う
+    if prefix is not None:
+        results = [t for t in results if t['SimpleName'].startswith(prefix)]
+    # 呼び出し側での変更がキャッシュへ波及しないようコピーを返す
+    return [dict(t) for t in results]
+
+
+def _list_tasks_uncached(author: Optional[str], prefix: Optional[str] = None) -> List[Dict[str, str]]:
+    """prefix (author 指定時のみ有効) に一致しないタスクは XML 確認の前に除外する。"""
+    # 既定（ShortRun_ のみ）はルートフォルダ直下だけを見ればよい
+    rows = _query_rows_com(recurse=author is not None)
+    dump_future: Optional[concurrent.futures.Future] = None
+    if rows is None:
+        if author is not None:
+            # CSV には Author/Enabled が無いため、全タスクの XML 取得を CSV と並行して始める
+            dump_future = _get_pool().submit(_query_all_task_meta)
+        rows = _query_rows_csv()
+        if rows is None and dump_future is not None:
+            # CSV が取れなくても XML だけで一覧は作れる（次回実行時刻/状態は空）
+            rows = [(n, '', '', meta) for n, meta in dump_future.result().items()]
+    if rows is None:
         return []
     results: List[Dict[str, str]] = []
-    rows: List[Tuple[str, str, str]] = []
-    for line in cp.stdout.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            parts = next(csv.reader([line]))
-        except Exception:
-            continue
-        if not parts:
-            continue
-        name = (parts[0] or "").lstrip('\\')
-        next_run = parts[1] if len(parts) > 1 else ''
-        status = parts[2] if len(parts) > 2 else ''
-        # 事前に配列へ溜める（author 指定時の並列処理のため）
-        rows.append((name, next_run, status))
 
     if author is None:
-        for name, next_run, status in rows:
+        for name, next_run, status, _meta in rows:
             # 既定: 名前で ShortRun_ のみ
             if not name.startswith(_TASK_PREFIX):
                 continue
@@ -176,11 +672,22 @@ def list_tasks(alias: Optional[str] = None, *, author: Optional[str] = None) ->
     else:
         # Author 指定時: Microsoft 配下は除外し、XML 確認を並列化
         target_author = author.strip().lower()
-        candidates = [(n, nr, st) for (n, nr, st) in rows if not n.lower().startswith("microsoft\\")]
-
-        def _probe(tpl: Tuple[str, str, str]) -> Optional[Dict[str, str]]:
-            n, nr, st = tpl
-            a, en = _get_author_and_enabled(n)
+        candidates = [
+            r for r in rows
+            if not r[0].lower().startswith("microsoft\\") and (prefix is None or r[0].startswith(prefix))
+        ]
+        if any(r[3] is None for r in candidates):
+            # CSV 経由では Author/Enabled が無いため、全タスクの XML を 1 回で取得して補完する
+            dump = dump_future.result() if dump_future is not None else _query_all_task_meta()
+            candidates = [
+                (n, nr, st, dump.get(n) if meta is None else meta)
+                for (n, nr, st, meta) in candidates
+            ]
+
+        def _probe(row: _TaskRow) -> Optional[Dict[str, str]]:
+            n, nr, st, meta = row
+            # COM/一括 XML で取得済みなら個別の問い合わせは不要
+            a, en = meta if meta is not None else _get_author_and_enabled(n)
             if (a or '').strip().lower() != target_author:
                 return None
             return {
@@ -193,25 +700,73 @@ def list_tasks(alias: Optional[str] = None, *, author: Optional[str] = None) ->
                 'Schedule': '',
             }
 
-        max_workers = max(2, min(8, (os.cpu_count() or 4)))
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as ex:
-            for res in ex.map(_probe, candidates):
+        if all(r[3] is not None for r in candidates):
+            results.extend(res for res in map(_probe, candidates) if res)
+        else:
+            # 一括取得に含まれなかったものだけ個別に XML を確認する
+            for res in _get_pool().map(_probe, candidates):
                 if res:
                     results.append(res)
-    # 追加の alias フィルタ（指定時）
-    if alias is not None:
-        prefix = _TASK_PREFIX + _sanitize(alias)
-        results = [t for t in results if t['SimpleName'].startswith(prefix)]
     return results
 
 
+def _schtasks_delete(name: str) -> None:
+    # 結果は見ないので出力は受け取らない
+    _run(["schtasks", "/Delete", "/TN", name, "/F"], capture=False)
+
+
 def delete_task_by_simple_name(simple_name: str) -> None:
-    _run(["schtasks", "/Delete", "/TN", simple_name, "/F"])
+    _delete_tasks([simple_name])
+
+
+def _delete_tasks(names: List[str]) -> None:
+    """Delete tasks in-process via COM, falling back to schtasks /Delete
+    only when the COM service itself is unavailable.
+    """
+    if not names:
+        return
+
+    def _delete(svc) -> bool:
+        svc.Connect()
+        folder = svc.GetFolder("\\")
+        for n in names:
+            try:
+                folder.DeleteTask(n, 0)
+            except Exception:
+                # 既に存在しないタスクは削除済みとみなす。他の失敗も schtasks で
+                # やり直しても同じ結果になるため、schtasks /Delete と同様に無視する
+                pass
+        return True
+
+    # COM が使えれば子プロセスを起動せずに 1 接続でまとめて削除する
+    if _with_task_service(_delete):
+        _invalidate_list_cache()
+        return
+    if len(names) == 1:
+        _schtasks_delete(names[0])
+    else:
+        # プロセス起動待ちが中心のため、author 確認と同じくスレッドで並列化
+        list(_get_pool().map(_schtasks_delete, names))
 
 
 def delete_all_for_alias(alias: str) -> None:
-    for t in list_tasks(alias):
-        delete_task_by_simple_name(t['SimpleName'])
+    _delete_tasks([t['SimpleName'] for t in list_tasks(alias)])
+
+
+_RL_MAP = {True: "HIGHEST", False: "LIMITED"}
+
+
+def _create_cmd(name: str, sc: str, exe_path: str, elevated: bool, *schedule_args: str) -> List[str]:
+    """schtasks /Create の共通部分を組み立てる（schedule_args は /SC の直後に入る）。"""
+    return [
+        "schtasks", "/Create",
+        "/TN", name,
+        "/SC", sc,
+        *schedule_args,
+        "/TR", _quote(exe_path),
+        "/RL", _RL_MAP[bool(elevated)],
+        "/F",
+    ]
 
 
 def ensure_logon_task(alias: str, exe_path: str, enabled: bool, *, elevated: bool = False, task_name: Optional[str] = None) -> None:
@@ -219,104 +774,52 @@ def ensure_logon_task(alias: str, exe_path: str, enabled: bool, *, elevated: boo
     if task_name:
         name = task_name
     if enabled:
-        # 既存は上書き
-        _run(["schtasks", "/Delete", "/TN", name, "/F"])
-        cmd = [
-            "schtasks", "/Create",
-            "/TN", name,
-            "/SC", "ONLOGON",
-            "/TR", _quote(exe_path),
-            "/RL", ("HIGHEST" if elevated else "LIMITED"),
-            "/F",
-        ]
-        cp = _run(cmd)
-        if cp.returncode != 0:
-            raise RuntimeError(cp.stderr or cp.stdout)
-        _ensure_author(name)
+        # 既存は /Create /F で上書きされる
+        cmd = _create_cmd(name, "ONLOGON", exe_path, elevated)
+        _create_task(name, cmd)
     else:
-        _run(["schtasks", "/Delete", "/TN", name, "/F"])
+        delete_task_by_simple_name(name)
 
 
 def create_daily_task(alias: str, exe_path: str, hhmm: str, *, sd: Optional[str] = None, ed: Optional[str] = None, et: Optional[str] = None, du: Optional[str] = None, elevated: bool = False, task_name: Optional[str] = None) -> None:
     # hh:mm を想定
-    try:
-        dt.datetime.strptime(hhmm, "%H:%M")
-    except ValueError:
-        raise ValueError("時刻は HH:MM 形式で指定してください")
+    _validate_hhmm(hhmm)
     name = task_name or _task_name(alias, "DAILY", hhmm.replace(":", "-"))
-    # 既存は上書き
-    _run(["schtasks", "/Delete", "/TN", name, "/F"])
-    cmd = [
-        "schtasks", "/Create",
-        "/TN", name,
-        "/SC", "DAILY",
+    # 既存は /Create /F で上書きされる
+    cmd = _create_cmd(
+        name, "DAILY", exe_path, elevated,
         "/ST", hhmm,
-        "/TR", _quote(exe_path),
-        "/RL", ("HIGHEST" if elevated else "LIMITED"),
-        "/F",
-    ]
+    )
     _append_schedule_window(cmd, sd=sd, ed=ed, et=et, du=du)
-    cp = _run(cmd)
-    if cp.returncode != 0:
-        raise RuntimeError(cp.stderr or cp.stdout)
-    _ensure_author(name)
+    _create_task(name, cmd)
 
 
 def create_once_task(alias: str, exe_path: str, date_str: str, hhmm: str, *, elevated: bool = False, task_name: Optional[str] = None) -> None:
     # date_str: YYYY/MM/DD or YYYY-MM-DD
     date_str = date_str.replace('-', '/')
-    try:
-        dt.datetime.strptime(date_str + ' ' + hhmm, "%Y/%m/%d %H:%M")
-    except ValueError:
+    if not (_is_ymd(date_str) and _is_hhmm(hhmm)):
         raise ValueError("日付は YYYY/MM/DD、時刻は HH:MM で指定してください")
     name = task_name or _task_name(alias, "ONCE", date_str.replace('/', '-') + '_' + hhmm.replace(":", "-"))
-    _run(["schtasks", "/Delete", "/TN", name, "/F"])
-    cmd = [
-        "schtasks", "/Create",
-        "/TN", name,
-        "/SC", "ONCE",
+    cmd = _create_cmd(
+        name, "ONCE", exe_path, elevated,
         "/SD", date_str,
         "/ST", hhmm,
-        "/TR", _quote(exe_path),
-        "/RL", ("HIGHEST" if elevated else "LIMITED"),
-        "/F",
-    ]
-    cp = _run(cmd)
-    if cp.returncode != 0:
-        raise RuntimeError(cp.stderr or cp.stdout)
-    _ensure_author(name)
+    )
+    _create_task(name, cmd)
 
 
 # 追加トリガー群 -----------------------------------------------------------
 
-def _validate_hhmm(hhmm: str) -> None:
-    try:
-        dt.datetime.strptime(hhmm, "%H:%M")
-    except ValueError:
-        raise ValueError("時刻は HH:MM 形式で指定してください")
-
-
 def ensure_onstart_task(alias: str, exe_path: str, enabled: bool, *, elevated: bool = False, task_name: Optional[str] = None) -> None:
     """Windows 起動時（ONSTART）のタスクを有効/無効にする。"""
     name = _task_name(alias, "ONSTART")
     if task_name:
         name = task_name
     if enabled:
-        _run(["schtasks", "/Delete", "/TN", name, "/F"])
-        cmd = [
-            "schtasks", "/Create",
-            "/TN", name,
-            "/SC", "ONSTART",
-            "/TR", _quote(exe_path),
-            "/RL", ("HIGHEST" if elevated else "LIMITED"),
-            "/F",
-        ]
-        cp = _run(cmd)
-        if cp.returncode != 0:
-            raise RuntimeError(cp.stderr or cp.stdout)
-        _ensure_author(name)
+        cmd = _create_cmd(name, "ONSTART", exe_path, elevated)
+        _create_task(name, cmd)
     else:
-        _run(["schtasks", "/Delete", "/TN", name, "/F"])
+        delete_task_by_simple_name(name)
 
 
 def create_minutely_task(alias: str, exe_path: str, every_minutes: int, start_time: str, *, sd: Optional[str] = None, ed: Optional[str] = None, et: Optional[str] = None, du: Optional[str] = None, elevated: bool = False, task_name: Optional[str] = None) -> None:
@@ -325,22 +828,13 @@ def create_minutely_task(alias: str, exe_path: str, every_minutes: int, start_ti
         raise ValueError("分間隔は 1〜1439 の範囲で指定してください")
     _validate_hhmm(start_time)
     name = task_name or _task_name(alias, "MINUTE", f"every{every_minutes}_at_{start_time.replace(':','-')}")
-    _run(["schtasks", "/Delete", "/TN", name, "/F"])
-    cmd = [
-        "schtasks", "/Create",
-        "/TN", name,
-        "/SC", "MINUTE",
+    cmd = _create_cmd(
+        name, "MINUTE", exe_path, elevated,
         "/MO", str(every_minutes),
         "/ST", start_time,
-        "/TR", _quote(exe_path),
-        "/RL", ("HIGHEST" if elevated else "LIMITED"),
-        "/F",
-    ]
+    )
     _append_schedule_window(cmd, sd=sd, ed=ed, et=et, du=du)
-    cp = _run(cmd)
-    if cp.returncode != 0:
-        raise RuntimeError(cp.stderr or cp.stdout)
-    _ensure_author(name)
+    _create_task(name, cmd)
 
 
 def create_hourly_task(alias: str, exe_path: str, every_hours: int, start_time: str, *, sd: Optional[str] = None, ed: Optional[str] = None, et: Optional[str] = None, du: Optional[str] = None, elevated: bool = False, task_name: Optional[str] = None) -> None:
@@ -349,22 +843,13 @@ def create_hourly_task(alias: str, exe_path: str, every_hours: int, start_time:
         raise ValueError("時間間隔は 1〜168 の範囲で指定してください")
     _validate_hhmm(start_time)
     name = task_name or _task_name(alias, "HOURLY", f"every{every_hours}_at_{start_time.replace(':','-')}")
-    _run(["schtasks", "/Delete", "/TN", name, "/F"])
-    cmd = [
-        "schtasks", "/Create",
-        "/TN", name,
-        "/SC", "HOURLY",
+    cmd = _create_cmd(
+        name, "HOURLY", exe_path, elevated,
         "/MO", str(every_hours),
         "/ST", start_time,
-        "/TR", _quote(exe_path),
-        "/RL", ("HIGHEST" if elevated else "LIMITED"),
-        "/F",
-    ]
+    )
     _append_schedule_window(cmd, sd=sd, ed=ed, et=et, du=du)
-    cp = _run(cmd)
-    if cp.returncode != 0:
-        raise RuntimeError(cp.stderr or cp.stdout)
-    _ensure_author(name)
+    _create_task(name, cmd)
 
 
 _WEEKDAYS = {"MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN"}
@@ -380,23 +865,14 @@ def create_weekly_task(alias: str, exe_path: str, hhmm: str, days: List[str], we
         raise ValueError("曜日は MON,TUE,WED,THU,FRI,SAT,SUN から指定してください")
     dstr = ",".join(days_norm)
     name = task_name or _task_name(alias, "WEEKLY", f"{dstr}_{hhmm.replace(':','-')}_every{weeks_interval}")
-    _run(["schtasks", "/Delete", "/TN", name, "/F"])
-    cmd = [
-        "schtasks", "/Create",
-        "/TN", name,
-        "/SC", "WEEKLY",
+    cmd = _create_cmd(
+        name, "WEEKLY", exe_path, elevated,
         "/D", dstr,
         "/MO", str(weeks_interval),
         "/ST", hhmm,
-        "/TR", _quote(exe_path),
-        "/RL", ("HIGHEST" if elevated else "LIMITED"),
-        "/F",
-    ]
+    )
     _append_schedule_window(cmd, sd=sd, ed=ed, et=et, du=du)
-    cp = _run(cmd)
-    if cp.returncode != 0:
-        raise RuntimeError(cp.stderr or cp.stdout)
-    _ensure_author(name)
+    _create_task(name, cmd)
 
 
 _MONTHS = {"JAN","FEB","MAR","APR","MAY","JUN","JUL","AUG","SEP","OCT","NOV","DEC"}
@@ -451,25 +927,16 @@ def create_monthly_task(alias: str, exe_path: str, hhmm: str, days: List[str], m
     if mstr:
         suffix += f"_{mstr}"
     name = task_name or _task_name(alias, "MONTHLY", suffix)
-    _run(["schtasks", "/Delete", "/TN", name, "/F"])
-    cmd = [
-        "schtasks", "/Create",
-        "/TN", name,
-        "/SC", "MONTHLY",
+    cmd = _create_cmd(
+        name, "MONTHLY", exe_path, elevated,
         "/D", dstr,
         "/MO", str(months_interval),
         "/ST", hhmm,
-        "/TR", _quote(exe_path),
-        "/RL", ("HIGHEST" if elevated else "LIMITED"),
-        "/F",
-    ]
+    )
     if mstr:
         cmd.extend(["/M", mstr])
     _append_schedule_window(cmd, sd=sd, ed=ed, et=et, du=du)
-    cp = _run(cmd)
-    if cp.returncode != 0:
-        raise RuntimeError(cp.stderr or cp.stdout)
-    _ensure_author(name)
+    _create_task(name, cmd)
 
 
 def create_onidle_task(alias: str, exe_path: str, idle_minutes: int = 10, *, elevated: bool = False, task_name: Optional[str] = None) -> None:
@@ -477,20 +944,11 @@ def create_onidle_task(alias: str, exe_path: str, idle_minutes: int = 10, *, ele
     if idle_minutes < 1 or idle_minutes > 999:
         raise ValueError("アイドル分は 1〜999 の範囲で指定してください")
     name = task_name or _task_name(alias, "ONIDLE", f"after{idle_minutes}m")
-    _run(["schtasks", "/Delete", "/TN", name, "/F"])
-    cmd = [
-        "schtasks", "/Create",
-        "/TN", name,
-        "/SC", "ONIDLE",
+    cmd = _create_cmd(
+        name, "ONIDLE", exe_path, elevated,
         "/I", str(idle_minutes),
-        "/TR", _quote(exe_path),
-        "/RL", ("HIGHEST" if elevated else "LIMITED"),
-        "/F",
-    ]
-    cp = _run(cmd)
-    if cp.returncode != 0:
-        raise RuntimeError(cp.stderr or cp.stdout)
-    _ensure_author(name)
+    )
+    _create_task(name, cmd)
 
 
 def rename_task(old_name: str, new_name: str) -> None:
@@ -500,25 +958,24 @@ def rename_task(old_name: str, new_name: str) -> None:
     if cp.returncode != 0:
         raise RuntimeError(cp.stderr or cp.stdout)
     xml = cp.stdout
-    # Write to temp file
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".xml", mode="w", encoding="utf-8") as f:
-        f.write(xml)
-        tmp = f.name
-    try:
-        # Create new
-        cp2 = _run(["schtasks", "/Create", "/TN", new_name, "/XML", tmp, "/F"])
-        if cp2.returncode != 0:
-            raise RuntimeError(cp2.stderr or cp2.stdout)
-        # Delete old
-        _run(["schtasks", "/Delete", "/TN", old_name, "/F"])
-    finally:
-        try:
-            os.remove(tmp)
-        except Exception:
-            pass
+    # Create new
+    cp2 = _create_from_xml(new_name, xml)
+    if cp2.returncode != 0:
+        raise RuntimeError(cp2.stderr or cp2.stdout)
+    # Delete old
+    delete_task_by_simple_name(old_name)
 
 
 def change_task_enabled(name: str, enabled: bool) -> None:
+    def _set_enabled(svc) -> bool:
+        svc.Connect()
+        svc.GetFolder("\\").GetTask(name).Enabled = bool(enabled)
+        return True
+
+    # COM で切り替えられればプロセスを起動しない。失敗時は schtasks でエラーを報告する
+    if _with_task_service(_set_enabled):
+        _invalidate_list_cache()
+        return
     cmd = ["schtasks", "/Change", "/TN", name, "/ENABLE" if enabled else "/DISABLE"]
     cp = _run(cmd)
     if cp.returncode != 0:
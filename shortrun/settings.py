@@ -1,8 +1,12 @@
 from __future__ import annotations
+import contextlib
+import functools
 import json
 import os
+import stat
 import sys
-from typing import Any, Dict, Optional
+import tempfile
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 try:
     import win32com.client  # type: ignore
@@ -12,6 +16,8 @@ except Exception:  # pragma: no cover
 APP_NAME = "ShortRun"
 
 
+# 作成済みのディレクトリに毎回 makedirs を発行しないよう、結果はプロセス内で保持する
+@functools.lru_cache(maxsize=None)
 def _config_dir() -> str:
     base = os.environ.get("APPDATA") or os.path.expanduser("~")
     d = os.path.join(base, APP_NAME)
@@ -19,6 +25,7 @@ def _config_dir() -> str:
     return d
 
 
+@functools.lru_cache(maxsize=None)
 def _config_path() -> str:
     return os.path.join(_config_dir(), "config.json")
 
@@ -31,9 +38,24 @@ _DEFAULTS: Dict[str, Any] = {
 }
 
 
+# 最後に読み込んだ設定と、その時点のファイルの (mtime_ns, size)。
+# ファイルが変わっていなければ JSON を読み直さない
+_cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+
+
 def load_config() -> Dict[str, Any]:
+    global _cache
     path = _config_path()
-    if os.path.isfile(path):
+    try:
+        st = os.stat(path)
+        key: Optional[Tuple[int, int]] = (st.st_mtime_ns, st.st_size) if stat.S_ISREG(st.st_mode) else None
+    except OSError:
+        key = None
+    cached = _cache
+    if key is not None and cached is not None and cached[0] == key:
+        # 呼び出し側が変更しても共有状態に影響しないようコピーを返す
+        return dict(cached[1])
+    if key is not None:
         try:
             with open(path, "r", encoding="utf-8") as f:
                 data = json.load(f)
@@ -44,16 +66,35 @@ def load_config() -> Dict[str, Any]:
     # apply defaults
     for k, v in _DEFAULTS.items():
         data.setdefault(k, v)
+    if key is not None:
+        _cache = (key, dict(data))
     return data
 
 
 def save_config(cfg: Dict[str, Any]) -> None:
+    global _cache
     path = _config_path()
+    _cache = None
+    tmp: Optional[str] = None
     try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(cfg, f, ensure_ascii=False, indent=2)
+        # 書き込み途中で落ちても壊れた config.json が残らないよう、一時ファイルに
+        # 一括で書いてから置き換える（同時保存と衝突しないよう一時ファイル名は一意にする）
+        text = json.dumps(cfg, ensure_ascii=False, indent=2)
+        fd, tmp = tempfile.mkstemp(prefix="config.", suffix=".tmp", dir=os.path.dirname(path))
+        with open(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+        st = os.stat(path)
+        data = dict(cfg)
+        for k, v in _DEFAULTS.items():
+            data.setdefault(k, v)
+        _cache = ((st.st_mtime_ns, st.st_size), data)
     except Exception:
-        pass
+        if tmp is not None:
+            try:
+                os.remove(tmp)
+            except Exception:
+                pass
 
 
 # 自動起動関連はユーザー要望により削除
@@ -61,32 +102,45 @@ def save_config(cfg: Dict[str, Any]) -> None:
 
 # --- Convenience setters ---
 
+@contextlib.contextmanager
+def edit_config() -> Iterator[Dict[str, Any]]:
+    """現在の設定ファイルの内容を編集用の dict として渡し、ブロックを抜けたときに
+    変更があれば 1 回だけ保存する。複数のキーを変える場合はまとめてこの中で行う。
+    GUI の各部分は別々の cfg のコピーを持つため、基準は常にファイルの内容とする
+    （load_config はファイルが変わっていなければ再解析しない）。
+    """
+    cfg = load_config()
+    yield cfg
+    if cfg != load_config():
+        save_config(cfg)
+
+
+# 以下の setter の cfg 引数は互換のためだけに残しており、参照しない（非推奨）。
+# 更新はファイル上の設定に対して行い、更新後の設定全体を返す
+
+
 def set_theme(cfg: Dict[str, Any], theme: str) -> Dict[str, Any]:
     if theme not in ("system", "light", "dark"):
         theme = "system"
-    cfg = dict(cfg)
-    cfg["theme"] = theme
-    save_config(cfg)
-    return cfg
+    with edit_config() as new:
+        new["theme"] = theme
+    return new
 
 
 def set_last_tab(cfg: Dict[str, Any], index: int) -> Dict[str, Any]:
-    cfg = dict(cfg)
-    cfg["last_tab"] = int(index)
-    save_config(cfg)
-    return cfg
+    with edit_config() as new:
+        new["last_tab"] = int(index)
+    return new
 
 
 def set_show_uninstallers(cfg: Dict[str, Any], show: bool) -> Dict[str, Any]:
-    cfg = dict(cfg)
-    cfg["show_uninstallers"] = bool(show)
-    save_config(cfg)
-    return cfg
+    with edit_config() as new:
+        new["show_uninstallers"] = bool(show)
+    return new
 
 
 def set_run_as_admin(cfg: Dict[str, Any], run_as_admin: bool) -> Dict[str, Any]:
     """グローバル既定の「管理者として実行」設定を保存する。"""
-    cfg = dict(cfg)
-    cfg["run_as_admin"] = bool(run_as_admin)
-    save_config(cfg)
-    return cfg
+    with edit_config() as new:
+        new["run_as_admin"] = bool(run_as_admin)
+    return new